@@ -1,79 +1,173 @@
 """Agent orchestrating realtime conversation flows."""
 from __future__ import annotations
-from re import M
+
+import asyncio
+import functools
+import inspect
+from functools import lru_cache
 
 from agents.extensions.handoff_prompt import RECOMMENDED_PROMPT_PREFIX
 from agents import Runner, function_tool
 from agents.realtime import RealtimeAgent
 
-from dotenv import load_dotenv
+from .web_search_agent import get_search_agent
+from .sentiment_classifying import classify_sentiment
+from app.services.computer_use import search_advicehub, browse_query
 
+__all__ = ["get_starting_agent", "speculative_search"]
 
-load_dotenv()
+_INTERROGATIVE_WORDS = frozenset({
+    "who", "what", "when", "where", "why", "how", "which",
+    "is", "are", "was", "were", "do", "does", "did",
+    "can", "could", "will", "would", "should",
+})
 
-from .web_search_agent import search_agent
-from .sentiment_classifying import classify_sentiment
-from app.services.computer_use import search_advicehub, browse_query
 
+def _looks_like_question(text: str) -> bool:
+    stripped = text.strip().lower()
+    if not stripped:
+        return False
+    if stripped.endswith("?"):
+        return True
+    return stripped.split(None, 1)[0] in _INTERROGATIVE_WORDS
+
+
+class _SpeculativeSearch:
+    """Prefetch a likely web search while the assistant is still triaging.
+
+    When a user turn looks like a question, kick off the search agent
+    immediately; if the assistant then routes to web_search for the same
+    query, the answer is already in flight. Otherwise the task is cancelled
+    by the next prefetch, so mis-speculation costs one abandoned request.
+    """
+
+    def __init__(self) -> None:
+        self._query: str | None = None
+        self._task: asyncio.Task | None = None
+
+    def prefetch(self, text: str) -> None:
+        normalized = (text or "").strip()
+        if not _looks_like_question(normalized):
+            return
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._query = normalized.lower()
+        self._task = asyncio.create_task(Runner.run(get_search_agent(), input=normalized))
+        self._task.add_done_callback(_consume_task_result)
+
+    def take(self, query: str) -> asyncio.Task | None:
+        """Hand off the in-flight task if it matches the routed query."""
+        task, matched = self._task, self._query == (query or "").strip().lower()
+        if task is None or not matched or task.cancelled():
+            return None
+        self._task = None
+        self._query = None
+        return task
+
+
+def _consume_task_result(task: asyncio.Task) -> None:
+    # Retrieve the outcome so cancelled/failed speculation never surfaces as
+    # an "exception was never retrieved" warning.
+    if not task.cancelled():
+        task.exception()
+
+
+speculative_search = _SpeculativeSearch()
 
-@function_tool(name_override="web_search")
-async def execute_web_search(query: str) -> str:
-    """Run the async search agent to answer the query with fresh web context."""
-    run_result = await Runner.run(search_agent, input=query)
-    if run_result.final_output:
-        return str(run_result.final_output)
-    return "I could not find any relevant results."
 
+def _normalized_tool(name: str, *, fallback: str, empty_message: str | None = None):
+    """Wrap a tool body with the shared strip/empty-check/stringify preamble.
 
-@function_tool(name_override="sentiment_classifying")
+    Every tool here normalizes its primary argument, rejects blank input, and
+    coerces the result to a string; centralizing that keeps each invocation on
+    one short, uniform code path.
+    """
+
+    def decorate(fn):
+        signature = inspect.signature(fn)
+        primary = next(iter(signature.parameters))
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            normalized = (bound.arguments.get(primary) or "").strip()
+            if not normalized:
+                return empty_message or fallback
+            bound.arguments[primary] = normalized
+            output = await fn(*bound.args, **bound.kwargs)
+            return str(output) if output else fallback
+
+        return function_tool(name_override=name)(wrapper)
+
+    return decorate
+
+
+@_normalized_tool("web_search", fallback="I could not find any relevant results.")
+async def execute_web_search(query: str) -> str:
+    """Run the async search agent to answer the query with fresh web context."""
+    run_result = None
+    speculative = speculative_search.take(query)
+    if speculative is not None:
+        try:
+            run_result = await speculative
+        except Exception:
+            run_result = None
+    if run_result is None:
+        run_result = await Runner.run(get_search_agent(), input=query)
+    return run_result.final_output
+
+
+@_normalized_tool("sentiment_classifying", fallback="I could not classify the sentiment of the message.")
 async def execute_sentiment_classifying(message: str) -> str:
     """Classify the sentiment of the user's message."""
-    sentiment = await classify_sentiment(message)
-    return sentiment or "I could not classify the sentiment of the message."
+    return await classify_sentiment(message)
 
 
-@function_tool(name_override="search_advicehub")
+@_normalized_tool(
+    "search_advicehub",
+    fallback="Searched advicehub.ai, but the agent did not provide a summary.",
+    empty_message="I need the expert's name to search on advicehub.ai.",
+)
 async def search_advicehub_tool(search_query: str | None = None) -> str:
     """Run the computer-use automation agent to search advicehub.ai for an expert."""
-
-    normalized_query = (search_query or "").strip()
-    if not normalized_query:
-        return "I need the expert's name to search on advicehub.ai."
-    return await search_advicehub(normalized_query)
+    return await search_advicehub(search_query)
 
 
-@function_tool(name_override="browse_query")
+@_normalized_tool(
+    "browse_query",
+    fallback="Browsed for information, but the agent did not provide a summary.",
+    empty_message="I need a search query to browse for information.",
+)
 async def execute_browse_query(query: str, url: str | None = None) -> str:
     """Run the computer-use automation agent to browse and search for information on any website."""
+    return await browse_query(query, url)
 
-    normalized_query = (query or "").strip()
-    if not normalized_query:
-        return "I need a search query to browse for information."
-    return await browse_query(normalized_query, url)
-
-web_search_rt_agent = RealtimeAgent(
-    name="Realtime Voice Web Search Agent",
-    instructions=f"""{RECOMMENDED_PROMPT_PREFIX}
-    You are an FAQ agent. If you are speaking to a customer, you probably were transferred to from the assistant agent.
-    Use the following routine to support the customer.
-    # Routine
-    1. Identify the last question asked by the customer.
-    2. Use the web search tool to answer the question. Do not rely on your own knowledge.
-    3. If you cannot answer the question, transfer back to the assistant agent.""",
-    tools=[execute_web_search]
-)
-
-assistant_agent = RealtimeAgent(
-    name="Realtime Voice Assistant Agent",
-    instructions=(
-        f"{RECOMMENDED_PROMPT_PREFIX} "
-        "You are a helpful voice assistant agent. You provide to the point and succinct answers. You can use your tools to delegate questions to other appropriate agents."
-    ),
-    tools=[search_advicehub_tool, execute_sentiment_classifying, execute_browse_query],
-    handoffs=[web_search_rt_agent]
-)
-
-web_search_rt_agent.handoffs.append(assistant_agent)
-
+@lru_cache(maxsize=1)
 def get_starting_agent() -> RealtimeAgent:
+    """Build the realtime agent graph once, on first session start."""
+
+    # Instructions are resent on every realtime turn, so keep them to the
+    # minimum directive beyond the required handoff prefix.
+    web_search_rt_agent = RealtimeAgent(
+        name="Realtime Voice Web Search Agent",
+        instructions=(
+            f"{RECOMMENDED_PROMPT_PREFIX} "
+            "FAQ agent: answer the customer's last question with the web_search tool, "
+            "never from your own knowledge. If you cannot answer, transfer back to the assistant agent."
+        ),
+        tools=[execute_web_search]
+    )
+
+    assistant_agent = RealtimeAgent(
+        name="Realtime Voice Assistant Agent",
+        instructions=(
+            f"{RECOMMENDED_PROMPT_PREFIX} "
+            "Helpful voice assistant: answer succinctly and delegate to your tools when appropriate."
+        ),
+        tools=[search_advicehub_tool, execute_sentiment_classifying, execute_browse_query],
+        handoffs=[web_search_rt_agent]
+    )
+
+    web_search_rt_agent.handoffs.append(assistant_agent)
     return assistant_agent
@@ -5,22 +5,23 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Iterable
 
+from functools import lru_cache
+
 from openai.types.shared import Reasoning
 
 from agents import Agent, ModelSettings, Runner
-from dotenv import load_dotenv
-
-load_dotenv()
 
 
 logger = logging.getLogger(__name__)
 
 
-SENTIMENT_LABELS = {"positive", "negative", "neutral"}
-NEGATION_WORDS = {
+SENTIMENT_LABELS = frozenset({"positive", "negative", "neutral"})
+NEGATION_WORDS = frozenset({
     "no",
     "not",
     "never",
@@ -37,9 +38,9 @@ NEGATION_WORDS = {
     "won't",
     "wouldn't",
     "shouldn't",
-}
-INTENSIFIER_WORDS = {"really", "very", "extremely", "super", "so", "incredibly"}
-POSITIVE_WORDS = {
+})
+INTENSIFIER_WORDS = frozenset({"really", "very", "extremely", "super", "so", "incredibly"})
+POSITIVE_WORDS = frozenset({
     "amazing",
     "awesome",
     "good",
@@ -60,8 +61,8 @@ POSITIVE_WORDS = {
     "delighted",
     "perfect",
     "positive",
-}
-NEGATIVE_WORDS = {
+})
+NEGATIVE_WORDS = frozenset({
     "angry",
     "awful",
     "bad",
@@ -83,41 +84,210 @@ NEGATIVE_WORDS = {
     "annoyed",
     "irritated",
     "dissatisfied",
+})
+STRONG_POSITIVE_WORDS = frozenset({"ecstatic", "thrilled", "outstanding", "phenomenal"})
+STRONG_NEGATIVE_WORDS = frozenset({"furious", "devastated", "miserable", "horrendous", "appalling"})
+
+_TOKEN_RE = re.compile(r"[a-zA-Z']+")
+
+# Sentinel weights above the scoring range mark negations/intensifiers so the
+# per-token loop does a single hash probe instead of cascading set lookups.
+_NEGATION_SENTINEL = 100
+_INTENSIFIER_SENTINEL = 101
+_WEIGHTS: dict[str, int] = {
+    **dict.fromkeys(POSITIVE_WORDS, 1),
+    **dict.fromkeys(NEGATIVE_WORDS, -1),
+    **dict.fromkeys(STRONG_POSITIVE_WORDS, 2),
+    **dict.fromkeys(STRONG_NEGATIVE_WORDS, -2),
+    **dict.fromkeys(NEGATION_WORDS, _NEGATION_SENTINEL),
+    **dict.fromkeys(INTENSIFIER_WORDS, _INTENSIFIER_SENTINEL),
 }
-STRONG_POSITIVE_WORDS = {"ecstatic", "thrilled", "outstanding", "phenomenal"}
-STRONG_NEGATIVE_WORDS = {"furious", "devastated", "miserable", "horrendous", "appalling"}
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class HeuristicResult:
     label: str
     confidence: int
 
 
-sentiment_classifying_agent = Agent(
-    name="Sentiment Classifying Agent",
-    instructions=(
-        "Classify the sentiment of the provided message. "
-        "Output exactly one of: positive, negative, neutral."
-    ),
-    tools=[],
-    model="gpt-5-mini",
-    model_settings=ModelSettings(
-        reasoning=Reasoning(effort="minimal"),
-        verbosity="low",
-    ),
-)
+@lru_cache(maxsize=1)
+def get_sentiment_agent() -> Agent:
+    """Build the sentiment agent on first use so cold imports stay cheap."""
+
+    return Agent(
+        name="Sentiment Classifying Agent",
+        instructions=(
+            "Classify the sentiment of the provided message. "
+            "Output exactly one of: positive, negative, neutral."
+        ),
+        tools=[],
+        model="gpt-5-mini",
+        model_settings=ModelSettings(
+            reasoning=Reasoning(effort="minimal"),
+            verbosity="low",
+        ),
+    )
+
+
+# Voice sessions replay many near-identical short phrases ("thanks", "ok"),
+# so cache resolved labels by normalized text and skip the agent round-trip.
+_SENTIMENT_CACHE: OrderedDict[str, tuple[float, str]] = OrderedDict()
+_SENTIMENT_CACHE_MAXSIZE = 4096
+_SENTIMENT_CACHE_TTL_SECONDS = 600.0
+
+
+def _cached_sentiment(key: str) -> str | None:
+    entry = _SENTIMENT_CACHE.get(key)
+    if entry is None:
+        return None
+    cached_at, label = entry
+    if time.monotonic() - cached_at > _SENTIMENT_CACHE_TTL_SECONDS:
+        _SENTIMENT_CACHE.pop(key, None)
+        return None
+    _SENTIMENT_CACHE.move_to_end(key)
+    return label
+
+
+def _store_sentiment(key: str, label: str) -> None:
+    _SENTIMENT_CACHE[key] = (time.monotonic(), label)
+    _SENTIMENT_CACHE.move_to_end(key)
+    while len(_SENTIMENT_CACHE) > _SENTIMENT_CACHE_MAXSIZE:
+        _SENTIMENT_CACHE.popitem(last=False)
+
+
+def _parse_sentiment_label(text: str) -> str | None:
+    candidate = text.strip().lower()
+    if candidate in SENTIMENT_LABELS:
+        return candidate
+    return None
+
+
+class _SentimentBatcher:
+    """Coalesce concurrent sentiment requests into one agent call.
+
+    Every sentiment classification shares the same instructions and model, so
+    requests arriving within a short window are numbered into a single prompt
+    and dispatched together; each waiter gets its own line of the answer back.
+    A lone request inside the window falls through to the one-shot path so
+    interactive turns never pay batching overhead.
+    """
+
+    def __init__(self, *, window_seconds: float = 0.02, max_batch_size: int = 16):
+        self._window_seconds = window_seconds
+        self._max_batch_size = max_batch_size
+        self._pending: list[tuple[str, asyncio.Future[str | None]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # The event loop only keeps weak references to tasks; hold a strong
+        # one per in-flight batch so it cannot be garbage-collected mid-run,
+        # stranding every waiter's future.
+        self._batch_tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, message: str) -> str | None:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[str | None] = loop.create_future()
+        self._pending.append((message, future))
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._window_seconds, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(lambda t, b=batch: self._finalize_batch(t, b))
+
+    def _finalize_batch(
+        self, task: asyncio.Task[None], batch: list[tuple[str, asyncio.Future[str | None]]]
+    ) -> None:
+        self._batch_tasks.discard(task)
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            logger.warning("Sentiment batch task died unexpectedly: %s", exc)
+        # _run_batch resolves every future on its normal paths; if it died
+        # unexpectedly (or was cancelled), release any waiter still parked.
+        for _, future in batch:
+            if not future.done():
+                future.set_result(None)
+
+    async def _run_batch(self, batch: list[tuple[str, asyncio.Future[str | None]]]) -> None:
+        if len(batch) == 1:
+            message, future = batch[0]
+            label = await _run_agent_sentiment(message)
+            if not future.done():
+                future.set_result(label)
+            return
+
+        numbered = "\n".join(f"{i}) {message}" for i, (message, _) in enumerate(batch, start=1))
+        prompt = (
+            "Classify the sentiment of each numbered message. "
+            "Reply with one label (positive, negative, or neutral) per line, in order.\n"
+            f"{numbered}"
+        )
+        labels: list[str | None] = [None] * len(batch)
+        try:
+            result = await Runner.run(get_sentiment_agent(), input=prompt)
+        except Exception as exc:  # pragma: no cover - network/API failure path
+            logger.warning("Batched sentiment call failed; falling back to heuristics: %s", exc)
+        else:
+            final_output = getattr(result, "final_output", None)
+            if isinstance(final_output, str):
+                lines = [line for line in final_output.splitlines() if line.strip()]
+                if len(lines) == len(batch):
+                    for i, line in enumerate(lines):
+                        # Tolerate "1) positive" style prefixes on each line.
+                        labels[i] = _parse_sentiment_label(line.split(")")[-1])
+                else:
+                    logger.debug(
+                        "Batched sentiment returned %d lines for %d messages", len(lines), len(batch)
+                    )
+
+        for (message, future), label in zip(batch, labels):
+            if not future.done():
+                future.set_result(label)
+
+
+_sentiment_batcher = _SentimentBatcher()
 
 
 async def _run_agent_sentiment(message: str) -> str | None:
+    """Stream the agent's answer and stop as soon as a label is recognizable.
+
+    The answer is a single word, so there is no point waiting for trailing
+    whitespace/punctuation tokens: cancel the run once the accumulated deltas
+    start with one of the labels.
+    """
+
     try:
-        result = await Runner.run(sentiment_classifying_agent, input=message)
+        result = Runner.run_streamed(get_sentiment_agent(), input=message)
+        accumulated = ""
+        async for event in result.stream_events():
+            if event.type != "raw_response_event":
+                continue
+            delta = getattr(event.data, "delta", None)
+            if not isinstance(delta, str):
+                continue
+            accumulated += delta
+            candidate = accumulated.strip().lower()
+            for label in SENTIMENT_LABELS:
+                if candidate.startswith(label):
+                    result.cancel()
+                    return label
     except Exception as exc:  # pragma: no cover - network/API failure path
         logger.warning("Sentiment agent call failed; falling back to heuristic: %s", exc)
         return None
 
-    final_output = getattr(result, "final_output", None)
-    if isinstance(final_output, str):
+    try:
+        final_output = result.final_output
+    except AttributeError:
+        final_output = None
+
+    # Exact type check: run results always carry plain str output here.
+    if type(final_output) is str:
         candidate = final_output.strip().lower()
         if candidate in SENTIMENT_LABELS:
             return candidate
@@ -128,39 +298,27 @@ async def _run_agent_sentiment(message: str) -> str | None:
 
 
 def _tokenize(text: str) -> Iterable[str]:
-    return re.findall(r"[a-zA-Z']+", text.lower())
+    return (match.group() for match in _TOKEN_RE.finditer(text.lower()))
 
 
 def _heuristic_sentiment(text: str) -> HeuristicResult:
-    tokens = list(_tokenize(text))
-    if not tokens:
-        return HeuristicResult("neutral", 0)
-
     score = 0
     pending_negation = False
     intensity_boost = 0
 
-    for token in tokens:
-        if token in NEGATION_WORDS:
-            pending_negation = True
+    for token in _tokenize(text):
+        weight = _WEIGHTS.get(token, 0)
+        if weight == 0:
             intensity_boost = 0
             continue
 
-        if token in INTENSIFIER_WORDS:
-            intensity_boost = min(intensity_boost + 1, 2)
+        if weight == _NEGATION_SENTINEL:
+            pending_negation = True
+            intensity_boost = 0
             continue
 
-        weight = 0
-        if token in STRONG_POSITIVE_WORDS:
-            weight = 2
-        elif token in STRONG_NEGATIVE_WORDS:
-            weight = -2
-        elif token in POSITIVE_WORDS:
-            weight = 1
-        elif token in NEGATIVE_WORDS:
-            weight = -1
-        else:
-            intensity_boost = 0
+        if weight == _INTENSIFIER_SENTINEL:
+            intensity_boost = min(intensity_boost + 1, 2)
             continue
 
         if intensity_boost:
@@ -187,9 +345,18 @@ async def classify_sentiment(message: str) -> str:
     if not normalized:
         return "neutral"
 
-    heuristic = _heuristic_sentiment(normalized)
-
-    agent_label = await _run_agent_sentiment(normalized)
+    cache_key = normalized.lower()
+    cached = _cached_sentiment(cache_key)
+    if cached is not None:
+        return cached
+
+    # The agent call is network-bound and dominates latency; run the CPU-only
+    # heuristic in a worker thread so it overlaps with the round-trip instead
+    # of serializing in front of it.
+    heuristic, agent_label = await asyncio.gather(
+        asyncio.to_thread(_heuristic_sentiment, normalized),
+        _sentiment_batcher.submit(normalized),
+    )
     if agent_label:
         if heuristic.label != "neutral" and heuristic.label != agent_label:
             logger.debug(
@@ -199,10 +366,14 @@ async def classify_sentiment(message: str) -> str:
                 heuristic.confidence,
                 normalized,
             )
-            return heuristic.label
-        return agent_label
+            label = heuristic.label
+        else:
+            label = agent_label
+    else:
+        label = heuristic.label
 
-    return heuristic.label
+    _store_sentiment(cache_key, label)
+    return label
 
 
 async def main() -> None:  # pragma: no cover - manual utility
@@ -1,12 +1,28 @@
 from __future__ import annotations
 
 import io
+import struct
 from typing import Optional
 
 from openai import OpenAI
 
 from app.services.did_talks import _pcm16le_to_wav
 
+# Realtime audio is always 24kHz 16-bit mono, so the fmt chunk never changes;
+# precompute it and only patch the two size fields per clip instead of
+# re-deriving the whole header in _pcm16le_to_wav on every turn.
+_WAV_FMT_24K_MONO = (
+    b"WAVE"
+    + b"fmt " + struct.pack("<IHHIIHH", 16, 1, 1, 24_000, 48_000, 2, 16)
+    + b"data"
+)
+_UINT32 = struct.Struct("<I")
+
+
+def _wav_from_pcm_24k(pcm: bytes) -> bytes:
+    data_size = len(pcm)
+    return b"".join((b"RIFF", _UINT32.pack(36 + data_size), _WAV_FMT_24K_MONO, _UINT32.pack(data_size), pcm))
+
 
 class TranscribeTalkAgent:
     """Lightweight agent that:
@@ -20,7 +36,10 @@ class TranscribeTalkAgent:
         self.chat_model = chat_model
 
     def transcribe_pcm(self, pcm: bytes, sample_rate: int = 24_000) -> str:
-        wav_bytes = _pcm16le_to_wav(pcm, sample_rate=sample_rate)
+        if sample_rate == 24_000:
+            wav_bytes = _wav_from_pcm_24k(pcm)
+        else:
+            wav_bytes = _pcm16le_to_wav(pcm, sample_rate=sample_rate)
         f = io.BytesIO(wav_bytes)
         f.name = "audio.wav"  # openai python SDK reads name for mime
         resp = self.client.audio.transcriptions.create(model=self.transcription_model, file=f)
@@ -8,18 +8,35 @@ _PROJECT_ROOT = _THIS_DIR.parent
 if str(_PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(_PROJECT_ROOT))
 
+import array
 import asyncio
-import base64
-import json
+import hashlib
+import io
 import logging
-import struct
+
+import msgspec
+import orjson
+
+# Install uvloop as the event-loop policy before FastAPI/uvicorn create a
+# loop, so runners launched without --loop uvloop still get it.
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - unavailable on Windows
+    pass
+else:
+    uvloop.install()
+
+from collections import deque
 from contextlib import asynccontextmanager, suppress
+from contextvars import ContextVar
+from functools import lru_cache
+from time import monotonic, time as _time
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Optional
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from typing_extensions import assert_never
+from fastapi.responses import ORJSONResponse
 
 from agents.realtime import RealtimeRunner, RealtimeSession, RealtimeSessionEvent
 from agents.realtime.config import RealtimeUserInputMessage
@@ -63,12 +80,49 @@ else:
 
 try:
     from .ai_agents.sentiment_classifying import classify_sentiment
+    from .ai_agents.realtime_conversation import speculative_search
 except ImportError:
     from ai_agents.sentiment_classifying import classify_sentiment
+    from ai_agents.realtime_conversation import speculative_search
+
+# Session id bound per connection so log lines carry it without every call
+# site rebuilding a "[Session ...]" prefix.
+session_id_var: ContextVar[str] = ContextVar("session_id", default="-")
+
+
+class _SessionIdFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.session_id = session_id_var.get()
+        return True
 
-logging.basicConfig(level=logging.ERROR)
+
+logging.basicConfig(
+    level=logging.ERROR,
+    format="%(levelname)s:%(name)s:[Session %(session_id)s] %(message)s",
+)
+for _handler in logging.getLogger().handlers:
+    _handler.addFilter(_SessionIdFilter())
 logger = logging.getLogger(__name__)
 
+
+async def _ws_send_json(websocket: "WebSocket", **payload: Any) -> None:
+    """Build and send one JSON control frame in a single call.
+
+    Control events stay on the text channel; binary frames are reserved for
+    tagged PCM audio.
+    """
+    await websocket.send_text(_json_dumps(payload))
+
+
+def _json_dumps(payload: Any) -> str:
+    """Serialize outbound websocket payloads with orjson (2-5x stdlib json).
+
+    JSON stays on text frames deliberately: binary frames are reserved for
+    tagged PCM, so clients can route on the frame type alone.
+    """
+    return orjson.dumps(payload).decode("utf-8")
+
+
 from app.services.did_talks import (
     DIDTalksService,
     resolve_persona_image,
@@ -76,6 +130,25 @@ from app.services.did_talks import (
 from app.services.did_talks import resolve_persona_source_url  # unused in realtime-only flow
 
 
+# How long the outbound writer lets a burst of events accumulate before
+# flushing them to the client as one coalesced frame.
+OUTBOX_COALESCE_SECONDS = 0.001
+
+# Leading byte on binary websocket frames carrying raw assistant PCM; the
+# client strips it and plays the remainder without any base64 decode.
+BINARY_AUDIO_TAG = b"\x01"
+
+# Initial reservation for the per-turn audio buffer: 2s of 24kHz mono PCM16.
+# Preallocating (and doubling on overflow) avoids the realloc-and-copy churn
+# of growing a fresh bytearray chunk by chunk across a long turn.
+AUDIO_BUFFER_INITIAL_BYTES = 96_000
+
+# Upper bound on recycled audio buffers kept alive between sessions.
+AUDIO_BUFFER_POOL_MAX = 32
+
+# Cap on pooled ResponseBuffer instances kept for reuse across turns.
+RESPONSE_BUFFER_POOL_MAX = 4
+
 VALID_SENTIMENTS = {"positive", "negative", "neutral"}
 SENTIMENT_VIDEO_MAP: dict[str, dict[str, str]] = {
     "joi": {
@@ -96,6 +169,152 @@ SENTIMENT_VIDEO_MAP: dict[str, dict[str, str]] = {
 }
 
 
+# Which kwargs each SDK class's model_dump accepts, discovered on first use
+# so later objects skip the TypeError-driven probe loop entirely.
+_MODEL_DUMP_KWARGS: dict[type, dict[str, Any] | None] = {}
+_UNPROBED: Any = object()
+
+# Content-part types carrying assistant text, hoisted out of the per-part loop.
+_TEXT_PART_TYPES = frozenset({"text", "output_text"})
+_AUDIO_PART_TYPES = frozenset({"audio", "output_audio"})
+# Wider sets for paths that also accept user-authored input parts.
+_ANY_TEXT_PART_TYPES = frozenset({"text", "input_text", "output_text"})
+_ANY_AUDIO_PART_TYPES = frozenset({"audio", "input_audio"})
+
+
+def _is_assistant_or_unattributed(data: dict[str, Any]) -> bool:
+    """True when a payload carries no role or is assistant-authored."""
+    role = data.get("role")
+    return not role or (isinstance(role, str) and role.strip().lower() == "assistant")
+
+
+def _part_text_candidate(
+    part: Any,
+    text_types: frozenset[str] = _TEXT_PART_TYPES,
+    audio_types: frozenset[str] = _AUDIO_PART_TYPES,
+) -> Optional[str]:
+    """Text payload of one content part (dict or model), or None.
+
+    Shared by every extract helper so the type ladder lives in one place.
+    """
+    if isinstance(part, dict):
+        ptype = part.get("type")
+        if ptype in text_types:
+            value = part.get("text")
+        elif ptype in audio_types:
+            value = part.get("transcript")
+        else:
+            return None
+    else:
+        ptype = getattr(part, "type", None)
+        if ptype in text_types:
+            value = getattr(part, "text", None)
+        elif ptype in audio_types:
+            value = getattr(part, "transcript", None)
+        else:
+            return None
+    return value if isinstance(value, str) else None
+
+
+_VALID_PERSONAS = frozenset({"joi", "officer_k", "officer_j"})
+
+# Microsoft voice per persona for D-ID text-mode generation.
+_PERSONA_VOICE_IDS = {
+    "joi": "en-US-AriaNeural",  # Sophisticated, warm female voice
+    "officer_k": "en-US-GuyNeural",  # Deep, authoritative male voice
+    "officer_j": "en-US-JennyNeural",  # Clear, professional female voice
+}
+
+
+@lru_cache(maxsize=8)
+def _persona_did_profile(persona: str) -> tuple[Optional[str], str]:
+    """Resolve a persona's (source_url, voice_id) once per process.
+
+    Source URLs come from the environment, which is fixed for the process
+    lifetime, so the pair per persona never changes once resolved.
+    """
+    source_url = resolve_persona_source_url(persona)
+    voice_id = _PERSONA_VOICE_IDS.get(persona.lower(), "en-US-JennyNeural")
+    return source_url, voice_id
+
+
+def _persona_has_text_gen(persona: str) -> bool:
+    return bool(_persona_did_profile(persona)[0])
+
+
+# Serialized history items keyed by object identity. The realtime SDK
+# replaces items rather than mutating them when content changes, so an
+# identity hit means the prior dump is still valid; the stored object
+# reference both pins the id() and lets us verify the hit.
+_HISTORY_DUMP_CACHE: dict[int, tuple[Any, bytes]] = {}
+_HISTORY_DUMP_CACHE_MAX = 1024
+
+
+def _serialize_history_updated(event: Any) -> dict[str, Any]:
+    # model_dump_json() serializes each item once on the pydantic-core Rust
+    # path; Fragment splices the raw JSON into the envelope so the history is
+    # not round-tripped through Python dicts and re-serialized by orjson.
+    # Unchanged items reuse their cached dump, making each update O(changed)
+    # instead of O(history).
+    cache = _HISTORY_DUMP_CACHE
+    parts: list[bytes] = []
+    for item in event.history:
+        key = id(item)
+        hit = cache.get(key)
+        if hit is not None and hit[0] is item:
+            parts.append(hit[1])
+        else:
+            dumped = item.model_dump_json().encode("utf-8")
+            cache[key] = (item, dumped)
+            parts.append(dumped)
+    if len(cache) > _HISTORY_DUMP_CACHE_MAX:
+        live = {id(item) for item in event.history}
+        for key in [k for k in cache if k not in live]:
+            del cache[key]
+    return {"type": "history_updated", "history": orjson.Fragment(b"[" + b",".join(parts) + b"]")}
+
+
+def _serialize_history_added(event: Any) -> dict[str, Any]:
+    # Provide the added item so the UI can render incrementally.
+    try:
+        item = event.item.model_dump(mode="json")
+    except Exception:
+        item = None
+    return {"type": "history_added", "item": item}
+
+
+# Per-event-type serializers, dispatched by string key instead of walking a
+# dozen-branch if/elif chain for every event on the stream.
+# Parameterless events serialize identically every time; share one payload
+# instance per type so the per-frame path allocates nothing. The writer only
+# reads enqueued payloads, never mutates them.
+_AUDIO_INTERRUPTED_EVENT = {"type": "audio_interrupted"}
+_AUDIO_END_EVENT = {"type": "audio_end"}
+_INPUT_AUDIO_TIMEOUT_EVENT = {"type": "input_audio_timeout_triggered"}
+
+_EVENT_SERIALIZERS: dict[str, Any] = {
+    "agent_start": lambda e: {"type": "agent_start", "agent": e.agent.name},
+    "agent_end": lambda e: {"type": "agent_end", "agent": e.agent.name},
+    "handoff": lambda e: {"type": "handoff", "from": e.from_agent.name, "to": e.to_agent.name},
+    "tool_start": lambda e: {"type": "tool_start", "tool": e.tool.name},
+    "tool_end": lambda e: {"type": "tool_end", "tool": e.tool.name, "output": str(e.output)},
+    # Audio goes out as a tagged binary frame: no base64 inflation here, no
+    # atob() in the browser.
+    "audio": lambda e: BINARY_AUDIO_TAG + e.audio.data,
+    "audio_interrupted": lambda e: _AUDIO_INTERRUPTED_EVENT,
+    "audio_end": lambda e: _AUDIO_END_EVENT,
+    "history_updated": _serialize_history_updated,
+    "history_added": _serialize_history_added,
+    "guardrail_tripped": lambda e: {
+        "type": "guardrail_tripped",
+        "guardrail_results": [{"name": result.guardrail.name} for result in e.guardrail_results],
+    },
+    "raw_model_event": lambda e: {"type": "raw_model_event", "raw_model_event": {"type": e.data.type}},
+    "error": lambda e: {"type": "error", "error": str(getattr(e, "error", "Unknown error"))},
+    "input_audio_timeout_triggered": lambda e: _INPUT_AUDIO_TIMEOUT_EVENT,
+}
+
+
 class ResponseState(Enum):
     """States for tracking the response lifecycle."""
     IDLE = "idle"
@@ -117,9 +336,10 @@ class BufferedTextPart:
 class ResponseBuffer:
     """Buffer for collecting response audio and text."""
     response_id: str
-    audio_chunks: list[bytes] = field(default_factory=list)
+    audio_buf: bytearray = field(default_factory=bytearray)
+    _audio_len: int = 0
     text_parts: list[BufferedTextPart] = field(default_factory=list)
-    started_at: float = field(default_factory=lambda: __import__('time').time())
+    started_at: float = field(default_factory=monotonic)
     video_generation_started: bool = False
     video_url: Optional[str] = None
     video_talk_id: Optional[str] = None
@@ -129,7 +349,12 @@ class ResponseBuffer:
     @property
     def total_audio_bytes(self) -> int:
         """Total bytes of audio collected."""
-        return sum(len(chunk) for chunk in self.audio_chunks)
+        return self._audio_len
+
+    def add_audio(self, chunk: bytes) -> None:
+        """Append a PCM chunk, keeping the running length current."""
+        self.audio_buf.extend(chunk)
+        self._audio_len += len(chunk)
 
     def add_text_part(self, text: str, role: str = "assistant") -> None:
         """Store a text fragment and its originating role."""
@@ -147,35 +372,95 @@ class ResponseBuffer:
         ).strip()
 
     def get_full_audio(self) -> bytes:
-        """Get the complete audio from all chunks."""
-        return b"".join(self.audio_chunks)
+        """Get the complete audio as one contiguous buffer."""
+        return bytes(self.audio_buf)
+
+    def reset(self, response_id: str) -> None:
+        """Rearm a pooled buffer for a new response, keeping allocations."""
+        self.response_id = response_id
+        self.audio_buf.clear()
+        self._audio_len = 0
+        self.text_parts.clear()
+        self.started_at = monotonic()
+        self.video_generation_started = False
+        self.video_url = None
+        self.video_talk_id = None
+        self.complete_text = None
+        self.complete_audio = None
+
+
+@dataclass(slots=True)
+class Session:
+    """Per-connection state, bundled so hot paths do one dict lookup.
+
+    Replaces the earlier parallel dicts (rt session, context, websocket,
+    audio buffer, persona) that were each keyed by session_id.
+    """
+    rt_session: RealtimeSession
+    context: Any
+    websocket: WebSocket
+    # Accumulates PCM 16-bit, 24kHz mono output for the current response;
+    # audio_len tracks how much of the preallocated buffer is filled.
+    audio_buffer: bytearray = field(default_factory=lambda: bytearray(AUDIO_BUFFER_INITIAL_BYTES))
+    audio_len: int = 0
+    # Selected persona (joi | officer_k | officer_j)
+    persona: str = "joi"
+    # At most one in-flight D-ID generation per session; a chatty agent
+    # queues behind it instead of fanning out unbounded API calls.
+    did_semaphore: asyncio.Semaphore = field(default_factory=lambda: asyncio.Semaphore(1))
+    # Mood tracking for the persona loop video
+    last_sentiment: str = "neutral"
+    persona_video: Optional[str] = None
+    # Buffered-response state
+    response_buffer: Optional[ResponseBuffer] = None
+    response_state: ResponseState = ResponseState.IDLE
+    response_counter: int = 0
+    # Immediate-mode response tracking; the text list exists only while a
+    # response is in flight so stray deltas outside one are dropped.
+    active_response_id: Optional[str] = None
+    active_response_text: Optional[list[str]] = None
+    # Clients that render a "thinking" filler opt in via set_filler.
+    wants_filler: bool = False
+    # Digests of recent talk-driving texts; dedupes overlapping extractors.
+    recent_talk_keys: deque[bytes] = field(default_factory=lambda: deque(maxlen=8))
+
+    def append_audio(self, data: bytes) -> None:
+        buf = self.audio_buffer
+        end = self.audio_len + len(data)
+        if end > len(buf):
+            buf.extend(b"\0" * max(len(data), len(buf)))
+        buf[self.audio_len:end] = data
+        self.audio_len = end
+
+    def take_audio(self) -> bytes:
+        """Copy out the filled prefix and rewind, keeping the allocation."""
+        pcm = bytes(memoryview(self.audio_buffer)[: self.audio_len])
+        self.audio_len = 0
+        return pcm
 
 
 class RealtimeWebSocketManager:
     def __init__(self):
-        self.active_sessions: dict[str, RealtimeSession] = {}
-        self.session_contexts: dict[str, Any] = {}
-        self.websockets: dict[str, WebSocket] = {}
-        # Accumulate PCM 16-bit, 24kHz mono output per response for each session
-        self.response_audio_buffers: dict[str, bytearray] = {}
-        # Selected persona per session (joi | officer_k | officer_j)
-        self.persona: dict[str, str] = {}
-        self.last_sentiment: dict[str, str] = {}
-        self.persona_videos: dict[str, str] = {}
+        self.sessions: dict[str, Session] = {}
         self._event_tasks: dict[str, asyncio.Task] = {}
+        # Strong references to fire-and-forget D-ID tasks so they are not
+        # garbage-collected mid-flight; discarded when each completes.
+        self._talk_tasks: set[asyncio.Task] = set()
+        # Cross-session cap on concurrent D-ID generations.
+        self._did_global_semaphore = asyncio.Semaphore(4)
+        # Recycled audio buffers: under session churn, reconnects reuse a
+        # warm allocation instead of growing a fresh bytearray from zero.
+        self._audio_buf_pool: list[bytearray] = []
+        # Retired ResponseBuffers, reset and reused to avoid per-turn churn.
+        self._response_buffer_pool: list[ResponseBuffer] = []
+        # Coalescing outbound writer state per session
+        self._outboxes: dict[str, deque[dict[str, Any]]] = {}
+        self._outbox_wakeups: dict[str, asyncio.Event] = {}
+        self._writer_tasks: dict[str, asyncio.Task] = {}
         # Service instance (lazy)
         self._did_service: DIDTalksService | None = None
         self._default_webhook: Optional[str] = settings.did_webhook_url
 
-        # New response buffering system
-        self.response_buffers: dict[str, ResponseBuffer] = {}  # session_id -> current response buffer
-        self.response_states: dict[str, ResponseState] = {}  # session_id -> current state
-        self.response_counters: dict[str, int] = {}  # session_id -> response counter for unique IDs
-
-        # Response tracking for immediate mode
-        self.active_response_texts: dict[str, list[str]] = {}  # session_id -> accumulating text parts
-        self.active_response_ids: dict[str, str] = {}  # session_id -> current response_id
-
         # Configuration flags
         self.enable_response_buffering: bool = False  # Feature flag for buffering responses (disabled while fixing)
 
@@ -188,64 +473,92 @@ class RealtimeWebSocketManager:
                 raise
         return self._did_service
 
+    def _acquire_audio_buf(self) -> bytearray:
+        if self._audio_buf_pool:
+            return self._audio_buf_pool.pop()
+        return bytearray(AUDIO_BUFFER_INITIAL_BYTES)
+
+    def _release_audio_buf(self, buf: bytearray) -> None:
+        if len(self._audio_buf_pool) >= AUDIO_BUFFER_POOL_MAX:
+            return
+        # Shrink buffers that ballooned during a long turn back to the
+        # standard reservation before recycling them.
+        if len(buf) > AUDIO_BUFFER_INITIAL_BYTES:
+            del buf[AUDIO_BUFFER_INITIAL_BYTES:]
+        self._audio_buf_pool.append(buf)
+
+    def _spawn_talk_task(self, coro: Any) -> None:
+        """Launch a D-ID generation task, keeping a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._talk_tasks.add(task)
+        task.add_done_callback(self._talk_tasks.discard)
+
+    def _persona_for(self, session_id: str) -> str:
+        session = self.sessions.get(session_id)
+        return session.persona if session else "joi"
 
     async def connect(self, websocket: WebSocket, session_id: str):
         await websocket.accept()
-        self.websockets[session_id] = websocket
 
         agent = get_starting_agent()
-        runner = RealtimeRunner(agent)
+        # Dispatch tool calls as concurrent tasks so independent tools in one
+        # turn (search, sentiment, browse) overlap instead of stacking.
+        runner = RealtimeRunner(agent, config={"async_tool_calls": True})
         session_context = await runner.run()
-        session = await session_context.__aenter__()
-        self.active_sessions[session_id] = session
-        self.session_contexts[session_id] = session_context
-        # Initialize buffer and default persona
-        self.response_audio_buffers[session_id] = bytearray()
-        self.persona[session_id] = self.persona.get(session_id) or "joi"
-        self.last_sentiment.setdefault(session_id, "neutral")
+        rt_session = await session_context.__aenter__()
+        self.sessions[session_id] = Session(
+            rt_session=rt_session,
+            context=session_context,
+            websocket=websocket,
+            audio_buffer=self._acquire_audio_buf(),
+        )
 
         await self.send_persona_mood_update(session_id)
 
+        # Outbound coalescing writer
+        self._outboxes[session_id] = deque()
+        self._outbox_wakeups[session_id] = asyncio.Event()
+        self._writer_tasks[session_id] = asyncio.create_task(
+            self._write_outbox(session_id), name=f"deckard-outbox-writer-{session_id}"
+        )
+
         # Start event processing task
         task = asyncio.create_task(self._process_events(session_id), name=f"deckard-process-events-{session_id}")
         self._event_tasks[session_id] = task
 
     async def disconnect(self, session_id: str):
-        if session_id in self.session_contexts:
-            await self.session_contexts[session_id].__aexit__(None, None, None)
-            del self.session_contexts[session_id]
-        if session_id in self.active_sessions:
-            del self.active_sessions[session_id]
-        if session_id in self.websockets:
-            del self.websockets[session_id]
-        self.response_audio_buffers.pop(session_id, None)
-        self.persona.pop(session_id, None)
-        self.last_sentiment.pop(session_id, None)
-        self.persona_videos.pop(session_id, None)
-
+        # Stop the event and writer tasks before closing the session context,
+        # so neither is mid-iteration on a realtime session being torn down.
         task = self._event_tasks.pop(session_id, None)
-        if task:
-            task.cancel()
-            with suppress(asyncio.CancelledError):
-                await task
-
-        # Clean up new response tracking
-        self.response_buffers.pop(session_id, None)
-        self.response_states.pop(session_id, None)
-        self.response_counters.pop(session_id, None)
-        self.active_response_texts.pop(session_id, None)
-        self.active_response_ids.pop(session_id, None)
+        writer_task = self._writer_tasks.pop(session_id, None)
+        pending = [t for t in (task, writer_task) if t]
+        for t in pending:
+            t.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        session = self.sessions.pop(session_id, None)
+        if session is not None:
+            await session.context.__aexit__(None, None, None)
+            self._release_audio_buf(session.audio_buffer)
+            stale_buffer = session.response_buffer
+            if stale_buffer is not None and len(self._response_buffer_pool) < RESPONSE_BUFFER_POOL_MAX:
+                self._response_buffer_pool.append(stale_buffer)
+
+        self._outboxes.pop(session_id, None)
+        self._outbox_wakeups.pop(session_id, None)
 
     async def send_audio(self, session_id: str, audio_bytes: bytes):
-        if session_id in self.active_sessions:
-            await self.active_sessions[session_id].send_audio(audio_bytes)
+        session = self.sessions.get(session_id)
+        if session is not None:
+            await session.rt_session.send_audio(audio_bytes)
 
     async def send_client_event(self, session_id: str, event: dict[str, Any]):
         """Send a raw client event to the underlying realtime model."""
-        session = self.active_sessions.get(session_id)
+        session = self.sessions.get(session_id)
         if not session:
             return
-        await session.model.send_event(
+        await session.rt_session.model.send_event(
             RealtimeModelSendRawMessage(
                 message={
                     "type": event["type"],
@@ -256,29 +569,25 @@ class RealtimeWebSocketManager:
 
     async def send_user_message(self, session_id: str, message: RealtimeUserInputMessage):
         """Send a structured user message via the higher-level API (supports input_image)."""
-        session = self.active_sessions.get(session_id)
+        session = self.sessions.get(session_id)
         if not session:
             return
-        await session.send_message(message)  # delegates to RealtimeModelSendUserInput path
+        await session.rt_session.send_message(message)  # delegates to RealtimeModelSendUserInput path
 
     async def interrupt(self, session_id: str) -> None:
         """Interrupt current model playback/response for a session."""
-        session = self.active_sessions.get(session_id)
+        session = self.sessions.get(session_id)
         if not session:
             return
-        await session.interrupt()
+        await session.rt_session.interrupt()
 
     def _has_text_generation_available(self, persona: str) -> bool:
         """Check if text-based D-ID generation is available for this persona."""
-        try:
-            from app.services.did_talks import resolve_persona_source_url as _r
-        except Exception:
-            from services.did_talks import resolve_persona_source_url as _r
-        return bool(_r(persona))
+        return _persona_has_text_gen(persona)
 
     def _should_use_audio_for_did(self, persona: str) -> bool:
         """Check if we should use audio for D-ID generation (when no source URL is configured)."""
-        return not self._has_text_generation_available(persona)
+        return not _persona_has_text_gen(persona)
 
     def _resolve_persona_video(self, persona: str, sentiment: str) -> str:
         persona_key = (persona or "joi").lower()
@@ -321,20 +630,13 @@ class RealtimeWebSocketManager:
             if not part_dict:
                 continue
 
-            part_type = part_dict.get("type")
-            if part_type in {"text", "input_text", "output_text"}:
-                candidate = part_dict.get("text")
-            elif part_type in {"audio", "input_audio"}:
-                candidate = part_dict.get("transcript")
-            else:
-                candidate = None
-
-            if isinstance(candidate, str):
-                cleaned = candidate.strip()
-                if cleaned:
-                    text_parts.append(cleaned)
+            candidate = _part_text_candidate(
+                part_dict, _ANY_TEXT_PART_TYPES, _ANY_AUDIO_PART_TYPES
+            )
+            if candidate and (cleaned := candidate.strip()):
+                text_parts.append(cleaned)
 
-        return " ".join(text_parts).strip()
+        return " ".join(text_parts)
 
     async def send_persona_mood_update(
         self,
@@ -343,20 +645,22 @@ class RealtimeWebSocketManager:
         sentiment: Optional[str] = None,
         notify: bool = True,
     ) -> None:
-        persona = self.persona.get(session_id, "joi")
-        active_sentiment = sentiment or self.last_sentiment.get(session_id, "neutral")
+        session = self.sessions.get(session_id)
+        persona = session.persona if session else "joi"
+        active_sentiment = sentiment or (session.last_sentiment if session else "neutral")
 
         # Persist state for future updates
-        self.last_sentiment[session_id] = active_sentiment
         video_path = self._resolve_persona_video(persona, active_sentiment)
-        self.persona_videos[session_id] = video_path
+        if session:
+            session.last_sentiment = active_sentiment
+            session.persona_video = video_path
 
         if not notify:
             return
 
-        websocket = self.websockets.get(session_id)
-        if not websocket:
+        if not session:
             return
+        websocket = session.websocket
 
         payload = {
             "type": "client_info",
@@ -367,9 +671,9 @@ class RealtimeWebSocketManager:
         }
 
         try:
-            await websocket.send_text(json.dumps(payload))
+            await websocket.send_text(_json_dumps(payload))
             logger.info(
-                f"[Session {session_id}] Sent persona mood update: persona={persona}, sentiment={active_sentiment}, video={video_path}"
+                f"Sent persona mood update: persona={persona}, sentiment={active_sentiment}, video={video_path}"
             )
         except Exception as exc:
             logger.exception("Failed to send persona mood update: %s", exc)
@@ -379,91 +683,112 @@ class RealtimeWebSocketManager:
         if not text:
             return
 
+        # Question-shaped turns often route to web search; start it now so the
+        # assistant's triage overlaps with the search agent's kickoff.
+        speculative_search.prefetch(text)
+
         sentiment = await self._classify_sentiment(text)
         logger.info(
-            f"[Session {session_id}] Classified user sentiment as '{sentiment}'"
+            f"Classified user sentiment as '{sentiment}'"
         )
         await self.send_persona_mood_update(session_id, sentiment=sentiment)
 
     def _get_next_response_id(self, session_id: str) -> str:
         """Generate a unique response ID for a session."""
-        counter = self.response_counters.get(session_id, 0)
-        self.response_counters[session_id] = counter + 1
+        session = self.sessions[session_id]
+        counter = session.response_counter
+        session.response_counter = counter + 1
         return f"{session_id}_response_{counter}"
 
     def _set_response_state(self, session_id: str, state: ResponseState) -> None:
         """Set the response state for a session."""
-        old_state = self.response_states.get(session_id, ResponseState.IDLE)
-        self.response_states[session_id] = state
-        logger.info(f"[Session {session_id}] Response state: {old_state.value} -> {state.value}")
+        session = self.sessions.get(session_id)
+        if session is None:
+            return
+        old_state = session.response_state
+        session.response_state = state
+        logger.info("Response state: %s -> %s", old_state.value, state.value)
 
     def _start_response_buffer(self, session_id: str) -> ResponseBuffer:
         """Start a new response buffer for a session."""
         response_id = self._get_next_response_id(session_id)
-        buffer = ResponseBuffer(response_id=response_id)
-        self.response_buffers[session_id] = buffer
+        if self._response_buffer_pool:
+            buffer = self._response_buffer_pool.pop()
+            buffer.reset(response_id)
+        else:
+            buffer = ResponseBuffer(response_id=response_id)
+        self.sessions[session_id].response_buffer = buffer
         self._set_response_state(session_id, ResponseState.RESPONSE_STARTED)
-        logger.info(f"[Session {session_id}] Started new response buffer: {response_id}")
+        logger.info("Started new response buffer: %s", response_id)
         return buffer
 
     def _get_response_buffer(self, session_id: str) -> Optional[ResponseBuffer]:
         """Get the current response buffer for a session."""
-        return self.response_buffers.get(session_id)
+        session = self.sessions.get(session_id)
+        return session.response_buffer if session else None
 
     def _clear_response_buffer(self, session_id: str) -> None:
         """Clear the response buffer for a session."""
-        if session_id in self.response_buffers:
-            buffer = self.response_buffers[session_id]
-            logger.info(f"[Session {session_id}] Clearing response buffer: {buffer.response_id}")
-            del self.response_buffers[session_id]
+        session = self.sessions.get(session_id)
+        buffer = session.response_buffer if session else None
+        if session is not None and buffer is not None:
+            session.response_buffer = None
+            logger.info("Clearing response buffer: %s", buffer.response_id)
+            if len(self._response_buffer_pool) < RESPONSE_BUFFER_POOL_MAX:
+                self._response_buffer_pool.append(buffer)
         self._set_response_state(session_id, ResponseState.IDLE)
 
     async def _handle_buffered_audio(self, session_id: str, audio_data: bytes) -> None:
         """Handle audio data in buffering mode."""
-        websocket = self.websockets.get(session_id)
-        if not websocket:
+        session = self.sessions.get(session_id)
+        if session is None:
             return
 
         # Get or create response buffer
-        buffer = self._get_response_buffer(session_id)
-        current_state = self.response_states.get(session_id, ResponseState.IDLE)
+        buffer = session.response_buffer
 
-        if buffer is None or current_state == ResponseState.IDLE:
+        if buffer is None or session.response_state == ResponseState.IDLE:
             # Start new response
             buffer = self._start_response_buffer(session_id)
-            await self._send_filler_audio(session_id, "thinking")
-
-        # Add audio to buffer
-        buffer.audio_chunks.append(audio_data)
+            if session.wants_filler:
+                await self._send_filler_audio(session_id, "thinking")
+
+        # Add audio to buffer for bookkeeping only. The chunk still reaches
+        # the client immediately — _process_events serializes every "audio"
+        # event into the same BINARY_AUDIO_TAG frame right after this handler
+        # returns — so enqueueing it here too would send it twice. Video
+        # generation runs in parallel and announces itself with a follow-up
+        # talk_video event, so playback does not wait on the render.
+        buffer.add_audio(audio_data)
         self._set_response_state(session_id, ResponseState.BUFFERING)
 
     async def _send_filler_audio(self, session_id: str, filler_type: str = "thinking") -> None:
         """Send filler audio while processing response."""
-        websocket = self.websockets.get(session_id)
-        if not websocket:
+        session = self.sessions.get(session_id)
+        if not session:
             return
 
         # For now, send a simple notification - later we'll add actual filler audio
-        thinking_video = self.persona_videos.get(session_id)
+        thinking_video = session.persona_video
         if not thinking_video:
-            persona = self.persona.get(session_id, "joi")
-            thinking_video = self._resolve_persona_video(persona, self.last_sentiment.get(session_id, "neutral"))
-            self.persona_videos[session_id] = thinking_video
-
-        await websocket.send_text(json.dumps({
-            "type": "client_info",
-            "info": "response_processing",
-            "message": "Generating response with video...",
-            "filler_type": filler_type,
-            "video": thinking_video,
-        }))
-        logger.info(f"[Session {session_id}] Sent filler notification: {filler_type}")
+            thinking_video = self._resolve_persona_video(session.persona, session.last_sentiment)
+            session.persona_video = thinking_video
+
+        await _ws_send_json(
+            session.websocket,
+            type="client_info",
+            info="response_processing",
+            message="Generating response with video...",
+            filler_type=filler_type,
+            video=thinking_video,
+        )
+        logger.info("Sent filler notification: %s", filler_type)
 
     async def _handle_buffered_text(self, session_id: str, text: str, role: str = "assistant") -> None:
         """Handle text in buffering mode - start video generation and coordinate playback."""
         buffer = self._get_response_buffer(session_id)
         if not buffer:
-            logger.warning(f"[Session {session_id}] No response buffer found for text handling")
+            logger.warning("No response buffer found for text handling")
             return
 
         normalized_role = (role or "").strip().lower() or "assistant"
@@ -473,7 +798,7 @@ class RealtimeWebSocketManager:
         # Add text to buffer
         buffer.add_text_part(text, role=normalized_role)
         buffer.complete_text = buffer.get_full_text()
-        logger.info(f"[Session {session_id}] Added text to buffer, complete text: '{buffer.complete_text[:100]}{'...' if len(buffer.complete_text) > 100 else ''}'")
+        logger.info("Added text to buffer, complete text: '%.100s'", buffer.complete_text)
 
         # Start video generation if not already started
         if not buffer.video_generation_started:
@@ -481,29 +806,44 @@ class RealtimeWebSocketManager:
             self._set_response_state(session_id, ResponseState.GENERATING_VIDEO)
 
             # Start video generation in background
-            asyncio.create_task(self._generate_buffered_video(session_id, buffer))
+            self._spawn_talk_task(self._generate_buffered_video(session_id, buffer))
 
     def _coerce_to_dict(self, value: Any) -> dict[str, Any] | None:
         """Best-effort conversion of SDK response objects into plain dictionaries."""
         if isinstance(value, dict):
             return value
 
-        model_dump = getattr(value, "model_dump", None)
-        if callable(model_dump):
-            for kwargs in ({"mode": "json"}, {}):
-                try:
-                    dumped = model_dump(**kwargs)
-                except TypeError:
-                    continue
-                except Exception:
-                    dumped = None
-                if isinstance(dumped, dict):
-                    return dumped
+        cls = type(value)
+        kwargs = _MODEL_DUMP_KWARGS.get(cls, _UNPROBED)
+        if kwargs is _UNPROBED:
+            kwargs = None
+            if callable(getattr(cls, "model_dump", None)):
+                for candidate in ({"mode": "json"}, {}):
+                    try:
+                        dumped = value.model_dump(**candidate)
+                    except TypeError:
+                        continue
+                    except Exception:
+                        kwargs = candidate
+                        break
+                    kwargs = candidate
+                    _MODEL_DUMP_KWARGS[cls] = kwargs
+                    if isinstance(dumped, dict):
+                        return dumped
+                    break
+            _MODEL_DUMP_KWARGS[cls] = kwargs
+
+        if kwargs is not None:
+            try:
+                dumped = value.model_dump(**kwargs)
+            except Exception:
+                dumped = None
+            if isinstance(dumped, dict):
+                return dumped
 
         if hasattr(value, "__dict__"):
             try:
-                data = dict(value.__dict__)
-                return data
+                return dict(value.__dict__)
             except Exception:
                 return None
 
@@ -515,57 +855,52 @@ class RealtimeWebSocketManager:
         if not response_dict:
             return ""
 
+        coerce = self._coerce_to_dict
         text_parts: list[str] = []
         for item in response_dict.get("output", []) or []:
-            item_dict = self._coerce_to_dict(item)
+            item_dict = coerce(item)
             if not item_dict or item_dict.get("role") != "assistant":
                 continue
 
             for part in item_dict.get("content", []) or []:
-                part_dict = self._coerce_to_dict(part)
+                part_dict = coerce(part)
                 if not part_dict:
                     continue
 
-                part_type = part_dict.get("type")
-                if part_type in {"text", "output_text"}:
-                    candidate = part_dict.get("text")
-                elif part_type in {"audio", "output_audio"}:
-                    candidate = part_dict.get("transcript")
-                else:
-                    candidate = None
-
-                if isinstance(candidate, str):
-                    stripped = candidate.strip()
-                    if stripped:
-                        text_parts.append(stripped)
+                candidate = _part_text_candidate(part_dict)
+                if candidate and (stripped := candidate.strip()):
+                    text_parts.append(stripped)
 
-        return " ".join(text_parts).strip()
+        return " ".join(text_parts)
 
     async def _handle_assistant_response_output(self, session_id: str, response: Any) -> None:
-        """Route assistant response text into the appropriate video generation path."""
+        """Extract assistant text from a response payload and route it onward."""
         assistant_text = self._extract_assistant_text_from_response(response)
         if not assistant_text:
-            logger.info(f"[Session {session_id}] No assistant text found in response output")
+            logger.info("No assistant text found in response output")
             return
 
         logger.info(
-            f"[Session {session_id}] Assistant response text extracted: '{assistant_text[:200]}{'...' if len(assistant_text) > 200 else ''}'"
+            f"Assistant response text extracted: '{assistant_text[:200]}{'...' if len(assistant_text) > 200 else ''}'"
         )
+        await self._route_assistant_text(session_id, assistant_text)
 
+    async def _route_assistant_text(self, session_id: str, assistant_text: str) -> None:
+        """Route assistant text into the appropriate video generation path."""
         # Classify sentiment of assistant response to update persona mood
         sentiment = await self._classify_sentiment(assistant_text)
         logger.info(
-            f"[Session {session_id}] Classified assistant sentiment as '{sentiment}'"
+            f"Classified assistant sentiment as '{sentiment}'"
         )
         await self.send_persona_mood_update(session_id, sentiment=sentiment)
 
         if self.enable_response_buffering:
-            persona = self.persona.get(session_id, "joi")
+            persona = self._persona_for(session_id)
             if self._has_text_generation_available(persona):
                 await self._handle_buffered_text(session_id, assistant_text)
             else:
                 logger.info(
-                    f"[Session {session_id}] Persona {persona} lacks text generation support; skipping buffered video trigger"
+                    f"Persona {persona} lacks text generation support; skipping buffered video trigger"
                 )
             return
 
@@ -574,20 +909,19 @@ class RealtimeWebSocketManager:
     async def _generate_buffered_video(self, session_id: str, buffer: ResponseBuffer) -> None:
         """Generate video for buffered response and coordinate final playback."""
         try:
-            persona = self.persona.get(session_id, "joi")
-            logger.info(f"[Session {session_id}] Starting buffered video generation for response {buffer.response_id}")
+            persona = self._persona_for(session_id)
+            logger.info("Starting buffered video generation for response %s", buffer.response_id)
 
             # Generate the video
-            src = resolve_persona_source_url(persona)
+            src, voice_id = _persona_did_profile(persona)
             if not src:
-                logger.error(f"[Session {session_id}] No source URL for persona {persona}")
+                logger.error("No source URL for persona %s", persona)
                 await self._send_buffered_response_error(session_id, "No source URL configured")
                 return
 
             service = self._service()
-            voice_id = self._get_persona_voice_id(persona)
 
-            logger.info(f"[Session {session_id}] Calling D-ID API for buffered response")
+            logger.info("Calling D-ID API for buffered response")
             result = await service.generate_talk_from_text(
                 source_url=src,
                 text=buffer.complete_text,
@@ -599,283 +933,152 @@ class RealtimeWebSocketManager:
             buffer.video_talk_id = result.talk_id
 
             if result.status.lower() in {"done", "complete", "succeeded"} and result.result_url:
-                logger.info(f"[Session {session_id}] Video generation successful, coordinating playback")
+                logger.info("Video generation successful, coordinating playback")
                 await self._send_coordinated_response(session_id, buffer)
             else:
-                logger.error(f"[Session {session_id}] Video generation failed: {result.status}")
+                logger.error("Video generation failed: %s", result.status)
                 await self._send_buffered_response_error(session_id, f"Video generation failed: {result.status}")
 
         except Exception as e:
-            logger.exception(f"[Session {session_id}] Video generation error: {e}")
+            logger.exception(f"Video generation error: {e}")
             await self._send_buffered_response_error(session_id, str(e))
 
     async def _send_coordinated_response(self, session_id: str, buffer: ResponseBuffer) -> None:
         """Send the coordinated audio and video response."""
-        websocket = self.websockets.get(session_id)
-        if not websocket:
+        session = self.sessions.get(session_id)
+        if not session:
             return
+        websocket = session.websocket
 
         self._set_response_state(session_id, ResponseState.READY)
-        persona = self.persona.get(session_id, "joi")
-
-        # Send audio chunks for playback
-        for chunk in buffer.audio_chunks:
-            await websocket.send_text(json.dumps({
-                "type": "audio",
-                "audio": base64.b64encode(chunk).decode("utf-8")
-            }))
+        persona = session.persona
 
-        # Send video
-        await websocket.send_text(json.dumps({
+        # Audio already streamed progressively while the video rendered; the
+        # video and completion events share a single batched text frame.
+        events: list[dict[str, Any]] = []
+        events.append({
             "type": "talk_video",
             "persona": persona,
             "talk_id": buffer.video_talk_id,
             "status": "done",
             "url": buffer.video_url,
-            "coordinated": True  # Flag to indicate this is coordinated playback
-        }))
+            "coordinated": True,  # Flag to indicate this is coordinated playback
+        })
+        events.append({"type": "audio_end"})
+        await websocket.send_text(_json_dumps(events))
 
-        # Notify completion
-        await websocket.send_text(json.dumps({
-            "type": "audio_end"
-        }))
-
-        logger.info(f"[Session {session_id}] Sent coordinated response: {buffer.total_audio_bytes} bytes audio + video")
+        logger.info("Sent coordinated response: %d bytes audio + video", buffer.total_audio_bytes)
         self._clear_response_buffer(session_id)
 
     async def _send_buffered_response_error(self, session_id: str, error: str) -> None:
         """Send error and fall back to audio-only playback."""
-        websocket = self.websockets.get(session_id)
-        if not websocket:
+        session = self.sessions.get(session_id)
+        if not session:
             return
+        websocket = session.websocket
 
         buffer = self._get_response_buffer(session_id)
         if buffer:
-            # Send audio chunks for fallback playback
-            for chunk in buffer.audio_chunks:
-                await websocket.send_text(json.dumps({
-                    "type": "audio",
-                    "audio": base64.b64encode(chunk).decode("utf-8")
-                }))
-
-            await websocket.send_text(json.dumps({
-                "type": "audio_end"
-            }))
+            # Audio already streamed progressively; just close out the turn.
+            await _ws_send_json(websocket, type="audio_end")
 
         # Send error notification
-        await websocket.send_text(json.dumps({
-            "type": "talk_error",
-            "persona": self.persona.get(session_id, "joi"),
-            "error": error
-        }))
+        await _ws_send_json(
+            websocket, type="talk_error", persona=session.persona, error=error
+        )
 
-        logger.warning(f"[Session {session_id}] Sent buffered response error, fell back to audio-only")
+        logger.warning("Sent buffered response error, fell back to audio-only")
         self._clear_response_buffer(session_id)
 
     async def _handle_raw_model_event(self, session_id: str, event_data: Any) -> None:
-        """Handle raw OpenAI model events for response tracking."""
+        """Route raw OpenAI model events through the dispatch table."""
         try:
-            # Log comprehensive information about the raw event
-            logger.info(f"[Session {session_id}] Raw event received:")
-            logger.info(f"[Session {session_id}] - Type: {type(event_data)}")
-            logger.info(f"[Session {session_id}] - Data: {event_data}")
-
-            if hasattr(event_data, '__dict__'):
-                logger.info(f"[Session {session_id}] - Dict: {event_data.__dict__}")
-            if hasattr(event_data, '__dir__'):
-                logger.info(f"[Session {session_id}] - Dir: {[attr for attr in dir(event_data) if not attr.startswith('_')]}")
-
-            # Try multiple ways to extract event type
-            event_type = None
-            if hasattr(event_data, 'type'):
-                event_type = event_data.type
-                logger.info(f"[Session {session_id}] - Found type via attribute: {event_type}")
-            elif isinstance(event_data, dict) and 'type' in event_data:
-                event_type = event_data['type']
-                logger.info(f"[Session {session_id}] - Found type via dict: {event_type}")
-            elif hasattr(event_data, '__getitem__'):
-                try:
-                    event_type = event_data['type']
-                    logger.info(f"[Session {session_id}] - Found type via getitem: {event_type}")
-                except (KeyError, TypeError):
-                    pass
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Raw event: %r", event_data)
 
+            data = self._coerce_to_dict(event_data) or {}
+            event_type = data.get("type") or getattr(event_data, "type", None)
             if not event_type:
-                logger.warning(f"[Session {session_id}] Could not extract event type from raw event")
+                logger.debug("Could not extract event type from raw event")
                 return
 
-            logger.info(f"[Session {session_id}] Processing raw model event: {event_type}")
-
-            # Handle wrapped OpenAI events in raw_server_event
             if event_type == "raw_server_event":
-                # Extract nested OpenAI event
-                nested_data = None
-                if hasattr(event_data, 'data'):
-                    nested_data = event_data.data
-                elif isinstance(event_data, dict) and 'data' in event_data:
-                    nested_data = event_data['data']
-
-                if not nested_data:
-                    logger.warning(f"[Session {session_id}] No nested data in raw_server_event")
-                    return
-
-                # Get the actual OpenAI event type
-                openai_event_type = None
-                if isinstance(nested_data, dict):
-                    openai_event_type = nested_data.get('type')
-
-                if not openai_event_type:
-                    logger.info(f"[Session {session_id}] No OpenAI event type in nested data: {nested_data}")
+                # Unwrap the nested OpenAI event and dispatch on its type.
+                nested = data.get("data")
+                if not isinstance(nested, dict):
+                    nested = self._coerce_to_dict(nested) or {}
+                nested_type = nested.get("type")
+                if not nested_type:
+                    logger.debug("No OpenAI event type in nested data")
                     return
+                await self._dispatch_openai_event(session_id, nested_type, nested)
+                return
 
-                logger.info(f"[Session {session_id}] Processing OpenAI event: {openai_event_type}")
-
-                # Process OpenAI events
-                await self._process_openai_event(session_id, openai_event_type, nested_data)
-
-            elif event_type == "response.created":
-                # Try multiple ways to get response data
-                response_data = None
-                if hasattr(event_data, 'response'):
-                    response_data = event_data.response
-                elif isinstance(event_data, dict) and 'response' in event_data:
-                    response_data = event_data['response']
-
-                response_id = f'resp_{int(__import__("time").time())}'
-                if response_data:
-                    if hasattr(response_data, 'id'):
-                        response_id = response_data.id
-                    elif isinstance(response_data, dict) and 'id' in response_data:
-                        response_id = response_data['id']
-
-                self.active_response_ids[session_id] = response_id
-                self.active_response_texts[session_id] = []
-                logger.info(f"[Session {session_id}] Response started: {response_id}")
-
-            elif event_type == "response.text.delta":
-                # Try multiple ways to get delta
-                text_delta = ''
-                if hasattr(event_data, 'delta'):
-                    text_delta = event_data.delta
-                elif isinstance(event_data, dict) and 'delta' in event_data:
-                    text_delta = event_data['delta']
-
-                if text_delta and session_id in self.active_response_texts:
-                    self.active_response_texts[session_id].append(text_delta)
-
-            elif event_type == "response.text.done":
-                # Try multiple ways to get text content
-                text_content = ''
-                if hasattr(event_data, 'text'):
-                    text_content = event_data.text
-                elif isinstance(event_data, dict) and 'text' in event_data:
-                    text_content = event_data['text']
-
-                if text_content:
-                    logger.info(f"[Session {session_id}] Text done: '{text_content[:100]}{'...' if len(text_content) > 100 else ''}'")
-
-            elif event_type == "response.audio_transcript.done":
-                # Try multiple ways to get transcript
-                transcript = ''
-                if hasattr(event_data, 'transcript'):
-                    transcript = event_data.transcript
-                elif isinstance(event_data, dict) and 'transcript' in event_data:
-                    transcript = event_data['transcript']
-
-                if transcript:
-                    logger.info(f"[Session {session_id}] Audio transcript done: '{transcript[:100]}{'...' if len(transcript) > 100 else ''}'")
-
-            elif event_type == "response.output_item.done":
-                # This contains the complete item with all content
-                item = None
-                if hasattr(event_data, 'item'):
-                    item = event_data.item
-                elif isinstance(event_data, dict) and 'item' in event_data:
-                    item = event_data['item']
-
-                if item:
-                    logger.info(f"[Session {session_id}] Output item done, extracting text")
-
-            elif event_type == "response.done":
-                response_id = self.active_response_ids.get(session_id)
-                logger.info(f"[Session {session_id}] Response complete: {response_id}")
-
-                response_payload = None
-                if hasattr(event_data, 'response'):
-                    response_payload = event_data.response
-                elif isinstance(event_data, dict):
-                    response_payload = event_data.get('response')
-
-                await self._handle_assistant_response_output(session_id, response_payload)
-
-                # Clean up
-                self.active_response_texts.pop(session_id, None)
-                self.active_response_ids.pop(session_id, None)
-
+            await self._dispatch_openai_event(session_id, event_type, data)
         except Exception as e:
-            logger.exception(f"[Session {session_id}] Error handling raw model event: {e}")
-
-    async def _process_openai_event(self, session_id: str, event_type: str, event_data: dict) -> None:
-        """Process OpenAI events extracted from raw_server_event."""
-        try:
-            logger.info(f"[Session {session_id}] OpenAI event details: {event_type}")
-
-            if event_type == "response.created":
-                response_id = event_data.get('response', {}).get('id', f'resp_{int(__import__("time").time())}')
-                self.active_response_ids[session_id] = response_id
-                self.active_response_texts[session_id] = []
-                logger.info(f"[Session {session_id}] Response started: {response_id}")
-
-            elif event_type == "response.text.delta":
-                text_delta = event_data.get('delta', '')
-                if text_delta and session_id in self.active_response_texts:
-                    self.active_response_texts[session_id].append(text_delta)
-                    logger.info(f"[Session {session_id}] Text delta: '{text_delta}'")
-
-            elif event_type == "response.text.done":
-                text_content = event_data.get('text', '')
-                if text_content:
-                    logger.info(f"[Session {session_id}] Text done: '{text_content[:100]}{'...' if len(text_content) > 100 else ''}'")
-
-            elif event_type == "response.audio_transcript.delta":
-                transcript_delta = event_data.get('delta', '')
-                if transcript_delta and session_id in self.active_response_texts:
-                    self.active_response_texts[session_id].append(transcript_delta)
-                    logger.info(f"[Session {session_id}] Transcript delta: '{transcript_delta}'")
-
-            elif event_type == "response.audio_transcript.done":
-                transcript = event_data.get('transcript', '')
-                if transcript:
-                    logger.info(f"[Session {session_id}] Audio transcript done: '{transcript[:100]}{'...' if len(transcript) > 100 else ''}'")
-
-            elif event_type == "response.output_item.done":
-                item = event_data.get('item', {})
-                if item:
-                    logger.info(f"[Session {session_id}] Output item done, extracting text")
-
-            elif event_type == "conversation.item.created":
-                item = event_data.get('item', {})
-                if item and item.get('role') == 'assistant':
-                    logger.info(f"[Session {session_id}] Conversation item created for assistant")
-
-            elif event_type == "response.done":
-                response_id = self.active_response_ids.get(session_id)
-                logger.info(f"[Session {session_id}] Response complete: {response_id}")
-
-                await self._handle_assistant_response_output(
-                    session_id,
-                    event_data.get('response'),
-                )
-
-                # Clean up
-                self.active_response_texts.pop(session_id, None)
-                self.active_response_ids.pop(session_id, None)
+            logger.exception(f"Error handling raw model event: {e}")
 
-            else:
-                logger.info(f"[Session {session_id}] Unhandled OpenAI event: {event_type}")
+    async def _dispatch_openai_event(self, session_id: str, event_type: str, data: dict[str, Any]) -> None:
+        """Single hash lookup replacing the old per-event elif chains."""
+        handler = _RAW_EVENT_HANDLERS.get(event_type)
+        if handler is None:
+            logger.debug("Unhandled OpenAI event: %s", event_type)
+            return
+        await handler(self, session_id, data)
+
+    async def _on_response_created(self, session_id: str, data: dict[str, Any]) -> None:
+        response = data.get("response")
+        response_id = (response or {}).get("id") if isinstance(response, dict) else getattr(response, "id", None)
+        if not response_id:
+            response_id = f"resp_{int(_time())}"
+        session = self.sessions.get(session_id)
+        if session is not None:
+            session.active_response_id = response_id
+            session.active_response_text = []
+        logger.info("Response started: %s", response_id)
+
+    async def _on_text_delta(self, session_id: str, data: dict[str, Any]) -> None:
+        delta = data.get("delta", "")
+        if delta:
+            session = self.sessions.get(session_id)
+            if session is not None and session.active_response_text is not None:
+                session.active_response_text.append(delta)
+
+    async def _on_text_done(self, session_id: str, data: dict[str, Any]) -> None:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Text done: %.100s", data.get("text", ""))
+
+    async def _on_audio_transcript_done(self, session_id: str, data: dict[str, Any]) -> None:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Audio transcript done: %.100s", data.get("transcript", "")
+            )
 
-        except Exception as e:
-            logger.exception(f"[Session {session_id}] Error processing OpenAI event {event_type}: {e}")
+    async def _on_output_item_done(self, session_id: str, data: dict[str, Any]) -> None:
+        if data.get("item"):
+            logger.debug("Output item done")
+
+    async def _on_conversation_item_created(self, session_id: str, data: dict[str, Any]) -> None:
+        item = data.get("item")
+        if isinstance(item, dict) and item.get("role") == "assistant":
+            logger.debug("Conversation item created for assistant")
+
+    async def _on_response_done(self, session_id: str, data: dict[str, Any]) -> None:
+        session = self.sessions.get(session_id)
+        response_id = session.active_response_id if session else None
+        logger.info("Response complete: %s", response_id)
+
+        # Deltas usually reconstruct the full text already; joining them once
+        # here skips the dict-coercion sweep over the response payload.
+        parts = session.active_response_text if session else None
+        if session is not None:
+            session.active_response_id = None
+            session.active_response_text = None
+        full_text = "".join(parts).strip() if parts else ""
+        if full_text:
+            await self._route_assistant_text(session_id, full_text)
+        else:
+            await self._handle_assistant_response_output(session_id, data.get("response"))
 
     async def _extract_text_from_nested_item(self, session_id: str, item: dict) -> None:
         """Extract text from a nested item structure."""
@@ -887,41 +1090,36 @@ class RealtimeWebSocketManager:
             text_parts = []
 
             for part in content:
-                if isinstance(part, dict):
-                    part_type = part.get('type')
-                    if part_type == 'text':
-                        text = part.get('text', '')
-                        if text.strip():
-                            text_parts.append(text)
-                    elif part_type == 'audio':
-                        transcript = part.get('transcript', '')
-                        if transcript.strip():
-                            text_parts.append(transcript)
+                text = _part_text_candidate(part)
+                if text and text.strip():
+                    text_parts.append(text)
 
             if text_parts:
                 full_text = ' '.join(text_parts)
-                logger.info(f"[Session {session_id}] Extracted text from nested item: '{full_text[:100]}{'...' if len(full_text) > 100 else ''}'")
+                logger.debug("Extracted text from nested item: %.100s", full_text)
                 await self._trigger_video_from_text(session_id, full_text)
 
         except Exception as e:
-            logger.exception(f"[Session {session_id}] Error extracting text from nested item: {e}")
+            logger.exception(f"Error extracting text from nested item: {e}")
 
     async def _extract_text_from_any_event(self, session_id: str, event_type: str, event_data: dict) -> None:
         """Fallback: try to extract text from any event that might contain it."""
         try:
-            # Look for text or transcript in the event data
-            text_candidates = []
+            if not isinstance(event_data, dict):
+                return
 
-            role = (event_data.get('role') or '').strip().lower() if isinstance(event_data, dict) else ''
-            if role and role != 'assistant':
+            if not _is_assistant_or_unattributed(event_data):
                 logger.debug(
-                    f"[Session {session_id}] Skipping {event_type} with non-assistant role: {role}"
+                    "Skipping %s with non-assistant role", event_type
                 )
                 return
 
+            # Look for text or transcript in the event data
+            text_candidates = []
+
             # Direct text/transcript fields
-            direct_text = event_data.get('text') if isinstance(event_data, dict) else None
-            direct_transcript = event_data.get('transcript') if isinstance(event_data, dict) else None
+            direct_text = event_data.get('text')
+            direct_transcript = event_data.get('transcript')
             if isinstance(direct_text, str):
                 text_candidates.append(direct_text)
             if isinstance(direct_transcript, str):
@@ -929,285 +1127,283 @@ class RealtimeWebSocketManager:
 
             # Text in item content
             item = event_data.get('item', {})
-            if isinstance(item, dict):
-                item_role = (item.get('role') or '').strip().lower()
-                if item_role and item_role != 'assistant':
-                    logger.debug(
-                        f"[Session {session_id}] Skipping item content with role: {item_role}"
-                    )
-                    item = None
+            if isinstance(item, dict) and not _is_assistant_or_unattributed(item):
+                logger.debug(
+                    "Skipping item content with non-assistant role")
+                item = None
 
             if isinstance(item, dict):
                 content = item.get('content', [])
                 for part in content:
-                    if isinstance(part, dict):
-                        p_type = part.get('type')
-                        if p_type in {'text', 'output_text'}:
-                            text_value = part.get('text')
-                            if isinstance(text_value, str):
-                                text_candidates.append(text_value)
-                        elif p_type == 'audio':
-                            transcript_value = part.get('transcript')
-                            if isinstance(transcript_value, str):
-                                text_candidates.append(transcript_value)
+                    text_value = _part_text_candidate(part)
+                    if text_value is not None:
+                        text_candidates.append(text_value)
 
             # If we found any text, trigger video generation
             if text_candidates:
                 full_text = ' '.join(text_candidates)
                 if full_text.strip():
-                    logger.info(f"[Session {session_id}] Found text in {event_type}: '{full_text[:100]}{'...' if len(full_text) > 100 else ''}'")
+                    logger.debug("Found text in %s: %.100s", event_type, full_text)
                     await self._trigger_video_from_text(session_id, full_text)
 
         except Exception as e:
-            logger.debug(f"[Session {session_id}] No text found in event {event_type}: {e}")
+            logger.debug("No text found in event %s: %s", event_type, e)
 
     async def _extract_text_from_output_item(self, session_id: str, item: Any) -> None:
         """Extract text from a complete output item."""
         try:
-            item_type = getattr(item, 'type', None)
-            if item_type != 'message':
+            # Output items are typed models; direct attribute access takes the
+            # fast typed-lookup path instead of getattr's default fallback,
+            # with the surrounding except absorbing unexpected shapes.
+            if item.type != 'message':
                 return
 
-            role = getattr(item, 'role', None)
-            if role != 'assistant':
+            if item.role != 'assistant':
                 return
 
-            content = getattr(item, 'content', [])
+            content = item.content
             text_parts = []
 
             for part in content:
-                part_type = getattr(part, 'type', None)
-                if part_type == 'text':
-                    text = getattr(part, 'text', '')
-                    if text.strip():
-                        text_parts.append(text)
-                elif part_type == 'audio':
-                    transcript = getattr(part, 'transcript', '')
-                    if transcript.strip():
-                        text_parts.append(transcript)
+                text = _part_text_candidate(part)
+                if text and text.strip():
+                    text_parts.append(text)
 
             if text_parts:
                 full_text = ' '.join(text_parts)
-                logger.info(f"[Session {session_id}] Extracted text from output item: '{full_text[:100]}{'...' if len(full_text) > 100 else ''}'")
+                logger.debug("Extracted text from output item: %.100s", full_text)
                 await self._trigger_video_from_text(session_id, full_text)
 
         except Exception as e:
-            logger.exception(f"[Session {session_id}] Error extracting text from output item: {e}")
+            logger.exception(f"Error extracting text from output item: {e}")
+
+    def _claim_talk_text(self, session_id: str, text: str) -> bool:
+        """Record a text turn about to drive a talk; False if just claimed.
+
+        Several extractors walk overlapping event streams, so one assistant
+        turn can surface its text two or three times. A short window of
+        digests drops those repeats without blocking a genuine repeat of the
+        same phrase several turns later.
+        """
+        session = self.sessions.get(session_id)
+        if session is None:
+            return True
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+        if key in session.recent_talk_keys:
+            logger.debug("Skipping duplicate talk text: %.60s", text)
+            return False
+        session.recent_talk_keys.append(key)
+        return True
 
     async def _trigger_video_from_text(self, session_id: str, text: str) -> None:
         """Trigger D-ID video generation from extracted text."""
         if not text.strip():
             return
 
-        persona = self.persona.get(session_id, "joi")
-        logger.info(f"[Session {session_id}] Triggering video generation for persona {persona}")
+        if not self._claim_talk_text(session_id, text):
+            return
+
+        persona = self._persona_for(session_id)
+        logger.info("Triggering video generation for persona %s", persona)
 
         # Also classify sentiment when triggering video to ensure mood is updated
         sentiment = await self._classify_sentiment(text)
         logger.info(
-            f"[Session {session_id}] Classified text sentiment as '{sentiment}' for video generation"
+            f"Classified text sentiment as '{sentiment}' for video generation"
         )
         await self.send_persona_mood_update(session_id, sentiment=sentiment)
 
         if self._has_text_generation_available(persona):
-            logger.info(f"[Session {session_id}] Starting D-ID video generation with text: '{text[:100]}{'...' if len(text) > 100 else ''}'")
-            asyncio.create_task(self._create_talk_from_text_and_notify(session_id, text))
+            logger.info("Starting D-ID video generation with text: '%.100s'", text)
+            self._spawn_talk_task(self._create_talk_from_text_and_notify(session_id, text))
         else:
-            logger.info(f"[Session {session_id}] No text generation available for persona {persona} (no source URL configured)")
+            logger.info("No text generation available for persona %s (no source URL configured)", persona)
 
-    async def _process_events(self, session_id: str):
-        task = asyncio.current_task()
+    async def _on_session_audio(self, session_id: str, state: Session, event: Any) -> None:
+        # Intercept assistant audio stream and build a D-ID talk when the turn ends
+        persona = state.persona
+
+        # Check if we should use buffering for coordinated playback
+        if self.enable_response_buffering and self._has_text_generation_available(persona):
+            # Use new buffering system for coordinated audio/video
+            await self._handle_buffered_audio(session_id, event.audio.data)
+        else:
+            # Legacy audio handling - immediate playback and optional D-ID from audio
+            if self._should_use_audio_for_did(persona):
+                state.append_audio(event.audio.data)
+
+    async def _on_session_audio_end(self, session_id: str, state: Session, event: Any) -> None:
+        # Generate audio-based D-ID talk if no text source URL is configured
+        if self._should_use_audio_for_did(state.persona):
+            # Copy out the filled prefix; the preallocated buffer
+            # is rewound and reused for the next turn.
+            pcm = state.take_audio()
+            if pcm:
+                self._spawn_talk_task(self._create_talk_and_notify(session_id, pcm))
+
+    async def _on_session_history_added(self, session_id: str, state: Session, event: Any) -> None:
+        # If the assistant produced text, kick off a D-ID talk from text
+        logger.debug("Processing history_added event")
         try:
-            session = self.active_sessions[session_id]
-            websocket = self.websockets[session_id]
-
-            async for event in session:
-                # Intercept assistant audio stream and build a D-ID talk when the turn ends
-                if event.type == "audio":
-                    persona = self.persona.get(session_id, "joi")
-
-                    # Check if we should use buffering for coordinated playback
-                    if self.enable_response_buffering and self._has_text_generation_available(persona):
-                        # Use new buffering system for coordinated audio/video
-                        await self._handle_buffered_audio(session_id, event.audio.data)
-                    else:
-                        # Legacy audio handling - immediate playback and optional D-ID from audio
-                        if self._should_use_audio_for_did(persona):
-                            self.response_audio_buffers.setdefault(session_id, bytearray()).extend(event.audio.data)
-                elif event.type == "audio_end":
-                    # Generate audio-based D-ID talk if no text source URL is configured
-                    persona = self.persona.get(session_id, "joi")
-                    if self._should_use_audio_for_did(persona):
-                        pcm = bytes(self.response_audio_buffers.get(session_id, b""))
-                        self.response_audio_buffers[session_id] = bytearray()
-                        if pcm:
-                            asyncio.create_task(self._create_talk_and_notify(session_id, pcm))
-                elif event.type == "history_added":
-                    # If the assistant produced text, kick off a D-ID talk from text
-                    logger.info(f"[Session {session_id}] Processing history_added event")
+            # history_added events always carry a typed item; only
+            # message items expose a role.
+            item = event.item
+            item_type = item.type
+            role = item.role if item_type == "message" else None
+            logger.debug("History item: type=%s, role=%s", item_type, role)
+
+            if item_type == "message" and role == "assistant":
+                # Gather any text parts from content
+                text_parts: list[str] = []
+                content = item.content
+                logger.debug("Assistant message content has %d parts", len(content or []))
+
+                for i, part in enumerate(content or []):
                     try:
-                        item = getattr(event, "item", None)
-                        role = getattr(item, "role", None)
-                        item_type = getattr(item, "type", None)
-                        logger.info(f"[Session {session_id}] History item: type={item_type}, role={role}")
-
-                        if item_type == "message" and role == "assistant":
-                            # Gather any text parts from content
-                            text_parts: list[str] = []
-                            content = getattr(item, "content", [])
-                            logger.info(f"[Session {session_id}] Assistant message content has {len(content or [])} parts")
-
-                            for i, part in enumerate(content or []):
-                                try:
-                                    ptype = getattr(part, "type", None)
-
-                                    # Accept plain text or transcripts
-                                    if ptype in {"text", "output_text"}:
-                                        t = getattr(part, "text", None)
-                                        if isinstance(t, str) and t.strip():
-                                            text_parts.append(t)
-                                            logger.info(f"[Session {session_id}] Added text part: '{t[:100]}{'...' if len(t) > 100 else ''}'")
-                                    elif ptype == "audio":
-                                        tr = getattr(part, "transcript", None)
-                                        if isinstance(tr, str) and tr.strip():
-                                            text_parts.append(tr)
-                                            logger.info(f"[Session {session_id}] Added transcript part: '{tr[:100]}{'...' if len(tr) > 100 else ''}'")
-                                except Exception as part_error:
-                                    logger.warning(f"[Session {session_id}] Failed to process content part {i}: {part_error}")
-                                    continue
-
-                            full_text = " ".join(tp.strip() for tp in text_parts if tp.strip()).strip()
-                            logger.info(f"[Session {session_id}] Extracted full text ({len(full_text)} chars): '{full_text[:200]}{'...' if len(full_text) > 200 else ''}'")
-
-                            if full_text:
-                                persona = self.persona.get(session_id, "joi")
-                                logger.info(f"[Session {session_id}] Current persona: {persona}")
-
-                                # Classify sentiment of assistant message to update mood
-                                sentiment = await self._classify_sentiment(full_text)
-                                logger.info(
-                                    f"[Session {session_id}] Classified assistant message sentiment as '{sentiment}'"
-                                )
-                                await self.send_persona_mood_update(session_id, sentiment=sentiment)
-
-                                if self._has_text_generation_available(persona):
-                                    if self.enable_response_buffering:
-                                        # Use new buffering system for coordinated audio/video
-                                        await self._handle_buffered_text(
-                                            session_id,
-                                            full_text,
-                                            role=role,
-                                        )
-                                    else:
-                                        # Legacy immediate D-ID generation
-                                        logger.info(f"[Session {session_id}] Text generation available for persona {persona}, starting D-ID video generation")
-                                        asyncio.create_task(self._create_talk_from_text_and_notify(session_id, full_text))
-                                else:
-                                    logger.info(f"[Session {session_id}] No text generation available for persona {persona} (no source URL configured)")
-                            else:
-                                logger.info(f"[Session {session_id}] No text extracted from assistant message")
-                        elif item_type == "message" and role == "user":
-                            await self._handle_user_message_sentiment(session_id, item)
+                        # Accept plain text or transcripts
+                        t = _part_text_candidate(part)
+                        if t and (t := t.strip()):
+                            text_parts.append(t)
+                            logger.debug("Added text part: %.100s", t)
+                    except Exception as part_error:
+                        logger.warning("Failed to process content part %d: %s", i, part_error)
+                        continue
+
+                # Parts are stripped once at collection time, so the
+                # join needs no second pass over the strings.
+                full_text = " ".join(text_parts)
+                logger.debug("Extracted full text (%d chars): %.200s", len(full_text), full_text)
+
+                if full_text and self._claim_talk_text(session_id, full_text):
+                    persona = state.persona
+                    logger.debug("Current persona: %s", persona)
+
+                    # Classify sentiment of assistant message to update mood
+                    sentiment = await self._classify_sentiment(full_text)
+                    logger.info(
+                        f"Classified assistant message sentiment as '{sentiment}'"
+                    )
+                    await self.send_persona_mood_update(session_id, sentiment=sentiment)
+
+                    if self._has_text_generation_available(persona):
+                        if self.enable_response_buffering:
+                            # Use new buffering system for coordinated audio/video
+                            await self._handle_buffered_text(
+                                session_id,
+                                full_text,
+                                role=role,
+                            )
                         else:
-                            logger.info(f"[Session {session_id}] Skipping non-assistant message: type={item_type}, role={role}")
-                    except Exception as e:
-                        # Never break the event loop on parsing mishaps
-                        logger.exception(f"[Session {session_id}] Failed to inspect history_added for text: {e}")
-                elif event.type == "raw_model_event":
-                    # Handle raw model events for response tracking
-                    await self._handle_raw_model_event(session_id, event.data)
-
-                event_data = await self._serialize_event(event)
-                await websocket.send_text(json.dumps(event_data))
+                            # Legacy immediate D-ID generation
+                            logger.info("Text generation available for persona %s, starting D-ID video generation", persona)
+                            self._spawn_talk_task(self._create_talk_from_text_and_notify(session_id, full_text))
+                    else:
+                        logger.info("No text generation available for persona %s (no source URL configured)", persona)
+                else:
+                    logger.debug("No text extracted from assistant message")
+            elif item_type == "message" and role == "user":
+                await self._handle_user_message_sentiment(session_id, item)
+            else:
+                logger.debug("Skipping non-assistant message: type=%s, role=%s", item_type, role)
+        except Exception as e:
+            # Never break the event loop on parsing mishaps
+            logger.exception(f"Failed to inspect history_added for text: {e}")
+
+    async def _on_session_raw_model_event(self, session_id: str, state: Session, event: Any) -> None:
+        # Handle raw model events for response tracking
+        await self._handle_raw_model_event(session_id, event.data)
+
+    async def _process_events(self, session_id: str):
+        session_id_var.set(session_id)
+        task = asyncio.current_task()
+        try:
+            state = self.sessions[session_id]
+
+            async for event in state.rt_session:
+                # O(1) hash dispatch instead of an event-type elif ladder.
+                handler = _SESSION_EVENT_HANDLERS.get(event.type)
+                if handler is not None:
+                    await handler(self, session_id, state, event)
+
+                self._enqueue_event(session_id, await self._serialize_event(event))
         except asyncio.CancelledError:
-            logger.info(f"[Session {session_id}] Event processor cancelled")
+            logger.info("Event processor cancelled")
             raise
         except Exception as e:
-            logger.error(f"Error processing events for session {session_id}: {e}")
+            logger.error("Error processing events for session %s: %s", session_id, e)
         finally:
             if self._event_tasks.get(session_id) is task:
                 self._event_tasks.pop(session_id, None)
 
-    async def _serialize_event(self, event: RealtimeSessionEvent) -> dict[str, Any]:
-        base_event: dict[str, Any] = {
-            "type": event.type,
-        }
-
-        if event.type == "agent_start":
-            base_event["agent"] = event.agent.name
-        elif event.type == "agent_end":
-            base_event["agent"] = event.agent.name
-        elif event.type == "handoff":
-            base_event["from"] = event.from_agent.name
-            base_event["to"] = event.to_agent.name
-        elif event.type == "tool_start":
-            base_event["tool"] = event.tool.name
-        elif event.type == "tool_end":
-            base_event["tool"] = event.tool.name
-            base_event["output"] = str(event.output)
-        elif event.type == "audio":
-            base_event["audio"] = base64.b64encode(event.audio.data).decode("utf-8")
-        elif event.type == "audio_interrupted":
-            pass
-        elif event.type == "audio_end":
-            pass
-        elif event.type == "history_updated":
-            base_event["history"] = [item.model_dump(mode="json") for item in event.history]
-        elif event.type == "history_added":
-            # Provide the added item so the UI can render incrementally.
-            try:
-                base_event["item"] = event.item.model_dump(mode="json")
-            except Exception:
-                base_event["item"] = None
-        elif event.type == "guardrail_tripped":
-            base_event["guardrail_results"] = [
-                {"name": result.guardrail.name} for result in event.guardrail_results
-            ]
-        elif event.type == "raw_model_event":
-            base_event["raw_model_event"] = {
-                "type": event.data.type,
-            }
-        elif event.type == "error":
-            base_event["error"] = str(event.error) if hasattr(event, "error") else "Unknown error"
-        elif event.type == "input_audio_timeout_triggered":
-            pass
-        else:
-            assert_never(event)
+    def _enqueue_event(self, session_id: str, payload: dict[str, Any] | bytes) -> None:
+        """Queue an event (JSON dict or tagged binary frame) for the writer."""
+        outbox = self._outboxes.get(session_id)
+        if outbox is None:
+            return
+        outbox.append(payload)
+        wakeup = self._outbox_wakeups.get(session_id)
+        if wakeup is not None:
+            wakeup.set()
+
+    async def _write_outbox(self, session_id: str) -> None:
+        """Drain queued events to the client as coalesced frames.
+
+        Bursty event streams (per-chunk audio, history updates) produce many
+        small sends; batching a burst into one frame cuts syscalls and event
+        loop wakeups. Contiguous JSON events collapse into one text frame (a
+        single object or an array); contiguous tagged audio payloads collapse
+        into one binary frame, since raw PCM concatenates losslessly.
+        """
+        websocket = self.sessions[session_id].websocket
+        outbox = self._outboxes[session_id]
+        wakeup = self._outbox_wakeups[session_id]
+        try:
+            while True:
+                await wakeup.wait()
+                # Give the burst a moment to accumulate, then flush it whole.
+                await asyncio.sleep(OUTBOX_COALESCE_SECONDS)
+                wakeup.clear()
+                if not outbox:
+                    continue
+                batch = [outbox.popleft() for _ in range(len(outbox))]
+                idx, total = 0, len(batch)
+                while idx < total:
+                    if isinstance(batch[idx], (bytes, bytearray)):
+                        run_end = idx + 1
+                        while run_end < total and isinstance(batch[run_end], (bytes, bytearray)):
+                            run_end += 1
+                        if run_end - idx == 1:
+                            await websocket.send_bytes(batch[idx])
+                        else:
+                            await websocket.send_bytes(
+                                BINARY_AUDIO_TAG + b"".join(chunk[1:] for chunk in batch[idx:run_end])
+                            )
+                    else:
+                        run_end = idx + 1
+                        while run_end < total and not isinstance(batch[run_end], (bytes, bytearray)):
+                            run_end += 1
+                        run = batch[idx:run_end]
+                        await websocket.send_text(_json_dumps(run[0] if len(run) == 1 else run))
+                    idx = run_end
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Outbox writer failed for session %s: %s", session_id, e)
 
-        return base_event
+    async def _serialize_event(self, event: RealtimeSessionEvent) -> dict[str, Any] | bytes:
+        handler = _EVENT_SERIALIZERS.get(event.type)
+        if handler is None:
+            return {"type": event.type}
+        return handler(event)
 
-    async def _create_talk_and_notify(self, session_id: str, pcm: bytes) -> None:
-        websocket = self.websockets.get(session_id)
-        persona = self.persona.get(session_id, "joi")
-        if websocket is None:
+    async def _create_talk_and_notify(self, session_id: str, pcm: bytes | bytearray) -> None:
+        session = self.sessions.get(session_id)
+        if session is None:
             return
+        websocket, persona = session.websocket, session.persona
         try:
-            service = self._service()
-            image_path = resolve_persona_image(persona)
-            # Realtime outputs 24kHz mono PCM 16-bit
-            await websocket.send_text(json.dumps({
-                "type": "client_info",
-                "info": "did_talk_start",
-                "persona": persona,
-                "mode": "audio",
-            }))
-            result = await service.generate_talk_from_pcm(
-                pcm_bytes=pcm, sample_rate=24_000, persona_image_path=image_path
-            )
-            await websocket.send_text(json.dumps({
-                "type": "client_info",
-                "info": "did_talk_status",
-                "persona": persona,
-                "status": result.status,
-            }))
-            payload: dict[str, Any] = {
-                "type": "talk_video",
-                "persona": persona,
-                "talk_id": result.talk_id,
-                "status": result.status,
-                "url": result.result_url,
-            }
-            await websocket.send_text(json.dumps(payload))
+            async with session.did_semaphore, self._did_global_semaphore:
+                await self._create_talk_from_pcm(session_id, websocket, persona, pcm)
         except Exception as e:
             err_payload = {
                 "type": "talk_error",
@@ -1215,93 +1411,118 @@ class RealtimeWebSocketManager:
                 "error": str(e),
             }
             try:
-                await websocket.send_text(json.dumps(err_payload))
+                await websocket.send_text(_json_dumps(err_payload))
             except Exception:
                 logger.exception("Failed sending talk_error to client")
 
-    # STT path intentionally removed in realtime-only flow
+    async def _create_talk_from_pcm(
+        self, session_id: str, websocket: WebSocket, persona: str, pcm: bytes | bytearray
+    ) -> None:
+        service = self._service()
+        image_path = resolve_persona_image(persona)
+        # Realtime outputs 24kHz mono PCM 16-bit
+        await _ws_send_json(
+            websocket, type="client_info", info="did_talk_start", persona=persona, mode="audio"
+        )
+        result = await service.generate_talk_from_pcm(
+            pcm_bytes=pcm, sample_rate=24_000, persona_image_path=image_path
+        )
+        await _ws_send_json(
+            websocket, type="client_info", info="did_talk_status", persona=persona,
+            status=result.status,
+        )
+        await _ws_send_json(
+            websocket, type="talk_video", persona=persona, talk_id=result.talk_id,
+            status=result.status, url=result.result_url,
+        )
 
-    def _get_persona_voice_id(self, persona: str) -> str:
-        """Get the appropriate Microsoft voice ID for each persona."""
-        voice_mapping = {
-            "joi": "en-US-AriaNeural",  # Sophisticated, warm female voice
-            "officer_k": "en-US-GuyNeural",  # Deep, authoritative male voice
-            "officer_j": "en-US-JennyNeural",  # Clear, professional female voice
-        }
-        return voice_mapping.get(persona.lower(), "en-US-JennyNeural")
+    # STT path intentionally removed in realtime-only flow
 
     async def _create_talk_from_text_and_notify(self, session_id: str, text: str) -> None:
-        websocket = self.websockets.get(session_id)
-        persona = self.persona.get(session_id, "joi")
-        logger.info(f"[Session {session_id}] Starting D-ID talk generation for persona {persona}")
-
-        if websocket is None:
-            logger.error(f"[Session {session_id}] No websocket found, cannot notify client")
+        session = self.sessions.get(session_id)
+        if session is None:
+            logger.error("No session found, cannot notify client")
             return
+        websocket, persona = session.websocket, session.persona
+        logger.info("Starting D-ID talk generation for persona %s", persona)
 
         try:
-            # Resolve source URL from environment; required for text-mode
-            src = resolve_persona_source_url(persona)
-            logger.info(f"[Session {session_id}] Resolved source URL for {persona}: {src[:50] + '...' if src and len(src) > 50 else src}")
+            async with session.did_semaphore, self._did_global_semaphore:
+                # Resolve source URL from environment; required for text-mode
+                src, voice_id = _persona_did_profile(persona)
+                logger.info("Resolved source URL for %s: %.50s", persona, src)
 
-            if not src:
-                logger.warning(f"[Session {session_id}] No source URL configured for persona {persona}, skipping text-based D-ID generation")
-                return
+                if not src:
+                    logger.warning("No source URL configured for persona %s, skipping text-based D-ID generation", persona)
+                    return
 
-            service = self._service()
-            voice_id = self._get_persona_voice_id(persona)
-            logger.info(f"[Session {session_id}] Using voice ID: {voice_id}")
+                service = self._service()
+                logger.info("Using voice ID: %s", voice_id)
 
-            # Notify client that video generation is starting
-            logger.info(f"[Session {session_id}] Notifying client that D-ID talk generation is starting")
-            await websocket.send_text(json.dumps({
-                "type": "client_info",
-                "info": "did_talk_start",
-                "persona": persona,
-                "mode": "text",
-            }))
+                # Notify client that video generation is starting
+                logger.info("Notifying client that D-ID talk generation is starting")
+                await _ws_send_json(
+                    websocket, type="client_info", info="did_talk_start",
+                    persona=persona, mode="text",
+                )
 
-            logger.info(f"[Session {session_id}] Calling D-ID API with text: '{text[:100]}{'...' if len(text) > 100 else ''}'")
-            result = await service.generate_talk_from_text(
-                source_url=src,
-                text=text,
-                voice_id=voice_id,
-                webhook=self._default_webhook,
-            )
-            logger.info(f"[Session {session_id}] D-ID generation completed with status: {result.status}, talk_id: {result.talk_id}")
+                logger.info("Calling D-ID API with text: '%.100s'", text)
+                result = await service.generate_talk_from_text(
+                    source_url=src,
+                    text=text,
+                    voice_id=voice_id,
+                    webhook=self._default_webhook,
+                )
+                logger.info("D-ID generation completed with status: %s, talk_id: %s", result.status, result.talk_id)
 
-            # Notify client of generation status
-            logger.info(f"[Session {session_id}] Notifying client of D-ID status: {result.status}")
-            await websocket.send_text(json.dumps({
-                "type": "client_info",
-                "info": "did_talk_status",
-                "persona": persona,
-                "status": result.status,
-            }))
+                # Notify client of generation status
+                logger.info("Notifying client of D-ID status: %s", result.status)
+                await _ws_send_json(
+                    websocket, type="client_info", info="did_talk_status",
+                    persona=persona, status=result.status,
+                )
 
-            # Send the final video result
-            payload: dict[str, Any] = {
-                "type": "talk_video",
-                "persona": persona,
-                "talk_id": result.talk_id,
-                "status": result.status,
-                "url": result.result_url,
-            }
-            logger.info(f"[Session {session_id}] Sending video result: status={result.status}, url={result.result_url[:50] + '...' if result.result_url and len(result.result_url) > 50 else result.result_url}")
-            await websocket.send_text(json.dumps(payload))
+                # Send the final video result
+                logger.info("Sending video result: status=%s, url=%.50s", result.status, result.result_url)
+                await _ws_send_json(
+                    websocket, type="talk_video", persona=persona, talk_id=result.talk_id,
+                    status=result.status, url=result.result_url,
+                )
 
         except Exception as e:
-            logger.exception(f"[Session {session_id}] D-ID talk generation failed: {e}")
+            logger.exception(f"D-ID talk generation failed: {e}")
             err_payload = {
                 "type": "talk_error",
                 "persona": persona,
                 "error": str(e),
             }
             try:
-                await websocket.send_text(json.dumps(err_payload))
-                logger.info(f"[Session {session_id}] Sent error notification to client")
+                await websocket.send_text(_json_dumps(err_payload))
+                logger.info("Sent error notification to client")
             except Exception as send_error:
-                logger.exception(f"[Session {session_id}] Failed sending talk_error to client (text mode): {send_error}")
+                logger.exception(f"Failed sending talk_error to client (text mode): {send_error}")
+
+
+# Realtime session events that need side effects beyond forwarding; other
+# event types go straight to the serializer.
+_SESSION_EVENT_HANDLERS: dict[str, Any] = {
+    "audio": RealtimeWebSocketManager._on_session_audio,
+    "audio_end": RealtimeWebSocketManager._on_session_audio_end,
+    "history_added": RealtimeWebSocketManager._on_session_history_added,
+    "raw_model_event": RealtimeWebSocketManager._on_session_raw_model_event,
+}
+
+# OpenAI raw-event dispatch table; handlers receive an already-coerced dict.
+_RAW_EVENT_HANDLERS: dict[str, Any] = {
+    "response.created": RealtimeWebSocketManager._on_response_created,
+    "response.text.delta": RealtimeWebSocketManager._on_text_delta,
+    "response.audio_transcript.delta": RealtimeWebSocketManager._on_text_delta,
+    "response.text.done": RealtimeWebSocketManager._on_text_done,
+    "response.audio_transcript.done": RealtimeWebSocketManager._on_audio_transcript_done,
+    "response.output_item.done": RealtimeWebSocketManager._on_output_item_done,
+    "conversation.item.created": RealtimeWebSocketManager._on_conversation_item_created,
+    "response.done": RealtimeWebSocketManager._on_response_done,
+}
 
 
 manager = RealtimeWebSocketManager()
@@ -1309,163 +1530,338 @@ manager = RealtimeWebSocketManager()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    yield
+    # Eager tasks (3.12+) run fire-and-forget coroutines synchronously up to
+    # their first suspension, skipping Task scheduling for the many
+    # create_task calls on the event and D-ID notification paths.
+    eager_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_factory)
+    try:
+        yield
+    finally:
+        # Release the pooled D-ID HTTP client if a session ever created it.
+        if manager._did_service is not None:
+            await manager._did_service.aclose()
+
+
+# orjson-backed responses: HTTP endpoints serialize on the same C path the
+# websocket frames already use.
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+
+class AudioMsg(msgspec.Struct, tag="audio", tag_field="type"):
+    """Legacy JSON fallback for audio; the fast path is binary frames."""
+    data: list[int]
+
+
+class ImageMsg(msgspec.Struct, tag="image", tag_field="type"):
+    data_url: Optional[str] = None
+    text: Optional[str] = None
+
 
+class CommitAudioMsg(msgspec.Struct, tag="commit_audio", tag_field="type"):
+    pass
 
-app = FastAPI(lifespan=lifespan)
+
+class ImageStartMsg(msgspec.Struct, tag="image_start", tag_field="type"):
+    id: Optional[str] = None
+    text: Optional[str] = None
+
+
+class ImageChunkMsg(msgspec.Struct, tag="image_chunk", tag_field="type"):
+    id: Optional[str] = None
+    chunk: str = ""
+
+
+class ImageEndMsg(msgspec.Struct, tag="image_end", tag_field="type"):
+    id: Optional[str] = None
+
+
+class InterruptMsg(msgspec.Struct, tag="interrupt", tag_field="type"):
+    pass
+
+
+class SetPersonaMsg(msgspec.Struct, tag="set_persona", tag_field="type"):
+    persona: Optional[str] = None
+
+
+class SetFillerMsg(msgspec.Struct, tag="set_filler", tag_field="type"):
+    enabled: bool = True
+
+
+ClientMessage = (
+    AudioMsg
+    | ImageMsg
+    | CommitAudioMsg
+    | ImageStartMsg
+    | ImageChunkMsg
+    | ImageEndMsg
+    | InterruptMsg
+    | SetPersonaMsg
+    | SetFillerMsg
+)
+
+# One-pass Rust-speed parse + validation: decoding yields a typed struct
+# selected by the "type" tag, so handlers skip repeated dict lookups.
+_CLIENT_MESSAGE_DECODER = msgspec.json.Decoder(ClientMessage)
+
+
+def _image_user_message(data_url: str, prompt_text: str | None) -> RealtimeUserInputMessage:
+    """Build a structured user message carrying an input_image (and optional text)."""
+    content: list[dict[str, Any]] = [
+        {"type": "input_image", "image_url": data_url, "detail": "high"}
+    ]
+    if prompt_text:
+        content.append({"type": "input_text", "text": prompt_text})
+    return {"type": "message", "role": "user", "content": content}  # type: ignore[return-value]
+
+
+async def _handle_audio_message(
+    manager: RealtimeWebSocketManager,
+    websocket: WebSocket,
+    session_id: str,
+    message: AudioMsg,
+    image_buffers: dict[str, dict[str, Any]],
+) -> None:
+    # Convert int16 array to bytes in one C-level pass; no per-sample tuple
+    # marshalling like struct.pack(*data).
+    await manager.send_audio(session_id, array.array("h", message.data).tobytes())
+
+
+async def _handle_image_message(
+    manager: RealtimeWebSocketManager,
+    websocket: WebSocket,
+    session_id: str,
+    message: ImageMsg,
+    image_buffers: dict[str, dict[str, Any]],
+) -> None:
+    logger.info("Received image message from client (session %s).", session_id)
+    # Build a conversation.item.create with input_image (and optional input_text)
+    data_url = message.data_url
+    prompt_text = message.text or "Please describe this image."
+    if not data_url:
+        await websocket.send_text(
+            _json_dumps({"type": "error", "error": "No data_url for image message."})
+        )
+        return
+    logger.info(
+        "Forwarding image (structured message) to Realtime API (len=%d).",
+        len(data_url),
+    )
+    await manager.send_user_message(session_id, _image_user_message(data_url, prompt_text))
+    # Acknowledge to client UI
+    await websocket.send_text(
+        _json_dumps({"type": "client_info", "info": "image_enqueued", "size": len(data_url)})
+    )
+
+
+async def _handle_commit_audio_message(
+    manager: RealtimeWebSocketManager,
+    websocket: WebSocket,
+    session_id: str,
+    message: CommitAudioMsg,
+    image_buffers: dict[str, dict[str, Any]],
+) -> None:
+    # Force close the current input audio turn
+    await manager.send_client_event(session_id, {"type": "input_audio_buffer.commit"})
+
+
+async def _handle_image_start_message(
+    manager: RealtimeWebSocketManager,
+    websocket: WebSocket,
+    session_id: str,
+    message: ImageStartMsg,
+    image_buffers: dict[str, dict[str, Any]],
+) -> None:
+    img_id = str(message.id)
+    # Accumulate into a StringIO so finalizing is one getvalue() instead of a
+    # second O(N) pass joining a chunk list.
+    image_buffers[img_id] = {
+        "text": message.text or "Please describe this image.",
+        "buffer": io.StringIO(),
+        "count": 0,
+    }
+    await websocket.send_text(
+        _json_dumps({"type": "client_info", "info": "image_start_ack", "id": img_id})
+    )
+
+
+async def _handle_image_chunk_message(
+    manager: RealtimeWebSocketManager,
+    websocket: WebSocket,
+    session_id: str,
+    message: ImageChunkMsg,
+    image_buffers: dict[str, dict[str, Any]],
+) -> None:
+    img_id = str(message.id)
+    chunk = message.chunk
+    buf = image_buffers.get(img_id)
+    if buf is None:
+        return
+    buf["buffer"].write(chunk)
+    buf["count"] += 1
+    if buf["count"] % 10 == 0:
+        await websocket.send_text(
+            _json_dumps(
+                {
+                    "type": "client_info",
+                    "info": "image_chunk_ack",
+                    "id": img_id,
+                    "count": buf["count"],
+                }
+            )
+        )
+
+
+async def _handle_image_end_message(
+    manager: RealtimeWebSocketManager,
+    websocket: WebSocket,
+    session_id: str,
+    message: ImageEndMsg,
+    image_buffers: dict[str, dict[str, Any]],
+) -> None:
+    img_id = str(message.id)
+    buf = image_buffers.pop(img_id, None)
+    if buf is None:
+        await websocket.send_text(
+            _json_dumps({"type": "error", "error": "Unknown image id for image_end."})
+        )
+        return
+    # Finalizing a multi-MB data URL is one big copy; do it on a worker thread
+    # so audio frames keep flowing through the receive loop while the image is
+    # assembled.
+    data_url = await asyncio.to_thread(buf["buffer"].getvalue) or None
+    if not data_url:
+        await websocket.send_text(_json_dumps({"type": "error", "error": "Empty image."}))
+        return
+    logger.info(
+        "Forwarding chunked image (structured message) to Realtime API (len=%d).",
+        len(data_url),
+    )
+    await manager.send_user_message(session_id, _image_user_message(data_url, buf["text"]))
+    await websocket.send_text(
+        _json_dumps(
+            {
+                "type": "client_info",
+                "info": "image_enqueued",
+                "id": img_id,
+                "size": len(data_url),
+            }
+        )
+    )
+
+
+async def _handle_interrupt_message(
+    manager: RealtimeWebSocketManager,
+    websocket: WebSocket,
+    session_id: str,
+    message: InterruptMsg,
+    image_buffers: dict[str, dict[str, Any]],
+) -> None:
+    await manager.interrupt(session_id)
+
+
+async def _handle_set_filler_message(
+    manager: RealtimeWebSocketManager,
+    websocket: WebSocket,
+    session_id: str,
+    message: SetFillerMsg,
+    image_buffers: dict[str, dict[str, Any]],
+) -> None:
+    session_state = manager.sessions.get(session_id)
+    if session_state is not None:
+        session_state.wants_filler = message.enabled
+
+
+async def _handle_set_persona_message(
+    manager: RealtimeWebSocketManager,
+    websocket: WebSocket,
+    session_id: str,
+    message: SetPersonaMsg,
+    image_buffers: dict[str, dict[str, Any]],
+) -> None:
+    persona = (message.persona or "joi").lower()
+    if persona not in _VALID_PERSONAS:
+        await websocket.send_text(
+            _json_dumps({"type": "error", "error": f"Unknown persona: {persona}"})
+        )
+        return
+    session_state = manager.sessions.get(session_id)
+    if session_state is not None:
+        session_state.persona = persona
+    await websocket.send_text(
+        _json_dumps({"type": "client_info", "info": "persona_set", "persona": persona})
+    )
+    await manager.send_persona_mood_update(session_id)
+
+
+# Client message types dispatch through this table; new message types get a
+# Struct above, a handler with the shared signature, and an entry here.
+_MESSAGE_HANDLERS: dict[type, Any] = {
+    AudioMsg: _handle_audio_message,
+    ImageMsg: _handle_image_message,
+    CommitAudioMsg: _handle_commit_audio_message,
+    ImageStartMsg: _handle_image_start_message,
+    ImageChunkMsg: _handle_image_chunk_message,
+    ImageEndMsg: _handle_image_end_message,
+    InterruptMsg: _handle_interrupt_message,
+    SetPersonaMsg: _handle_set_persona_message,
+    SetFillerMsg: _handle_set_filler_message,
+}
 
 
 @app.websocket("/ws/{session_id}")
 async def websocket_endpoint(websocket: WebSocket, session_id: str):
+    # Bind before connect() so tasks spawned for this session inherit the id.
+    session_id_var.set(session_id)
     await manager.connect(websocket, session_id)
     image_buffers: dict[str, dict[str, Any]] = {}
     try:
         while True:
-            data = await websocket.receive_text()
-            message = json.loads(data)
-
-            if message["type"] == "audio":
-                # Convert int16 array to bytes
-                int16_data = message["data"]
-                audio_bytes = struct.pack(f"{len(int16_data)}h", *int16_data)
-                await manager.send_audio(session_id, audio_bytes)
-            elif message["type"] == "image":
-                logger.info("Received image message from client (session %s).", session_id)
-                # Build a conversation.item.create with input_image (and optional input_text)
-                data_url = message.get("data_url")
-                prompt_text = message.get("text") or "Please describe this image."
-                if data_url:
-                    logger.info(
-                        "Forwarding image (structured message) to Realtime API (len=%d).",
-                        len(data_url),
-                    )
-                    user_msg: RealtimeUserInputMessage = {
-                        "type": "message",
-                        "role": "user",
-                        "content": (
-                            [
-                                {"type": "input_image", "image_url": data_url, "detail": "high"},
-                                {"type": "input_text", "text": prompt_text},
-                            ]
-                            if prompt_text
-                            else [{"type": "input_image", "image_url": data_url, "detail": "high"}]
-                        ),
-                    }
-                    await manager.send_user_message(session_id, user_msg)
-                    # Acknowledge to client UI
-                    await websocket.send_text(
-                        json.dumps(
-                            {
-                                "type": "client_info",
-                                "info": "image_enqueued",
-                                "size": len(data_url),
-                            }
-                        )
-                    )
-                else:
-                    await websocket.send_text(
-                        json.dumps(
-                            {
-                                "type": "error",
-                                "error": "No data_url for image message.",
-                            }
-                        )
-                    )
-            elif message["type"] == "commit_audio":
-                # Force close the current input audio turn
-                await manager.send_client_event(session_id, {"type": "input_audio_buffer.commit"})
-            elif message["type"] == "image_start":
-                img_id = str(message.get("id"))
-                image_buffers[img_id] = {
-                    "text": message.get("text") or "Please describe this image.",
-                    "chunks": [],
-                }
-                await websocket.send_text(
-                    json.dumps({"type": "client_info", "info": "image_start_ack", "id": img_id})
-                )
-            elif message["type"] == "image_chunk":
-                img_id = str(message.get("id"))
-                chunk = message.get("chunk", "")
-                if img_id in image_buffers:
-                    image_buffers[img_id]["chunks"].append(chunk)
-                    if len(image_buffers[img_id]["chunks"]) % 10 == 0:
-                        await websocket.send_text(
-                            json.dumps(
-                                {
-                                    "type": "client_info",
-                                    "info": "image_chunk_ack",
-                                    "id": img_id,
-                                    "count": len(image_buffers[img_id]["chunks"]),
-                                }
-                            )
-                        )
-            elif message["type"] == "image_end":
-                img_id = str(message.get("id"))
-                buf = image_buffers.pop(img_id, None)
-                if buf is None:
-                    await websocket.send_text(
-                        json.dumps({"type": "error", "error": "Unknown image id for image_end."})
-                    )
-                else:
-                    data_url = "".join(buf["chunks"]) if buf["chunks"] else None
-                    prompt_text = buf["text"]
-                    if data_url:
-                        logger.info(
-                            "Forwarding chunked image (structured message) to Realtime API (len=%d).",
-                            len(data_url),
-                        )
-                        user_msg2: RealtimeUserInputMessage = {
-                            "type": "message",
-                            "role": "user",
-                            "content": (
-                                [
-                                    {
-                                        "type": "input_image",
-                                        "image_url": data_url,
-                                        "detail": "high",
-                                    },
-                                    {"type": "input_text", "text": prompt_text},
-                                ]
-                                if prompt_text
-                                else [
-                                    {"type": "input_image", "image_url": data_url, "detail": "high"}
-                                ]
-                            ),
-                        }
-                        await manager.send_user_message(session_id, user_msg2)
-                        await websocket.send_text(
-                            json.dumps(
-                                {
-                                    "type": "client_info",
-                                    "info": "image_enqueued",
-                                    "id": img_id,
-                                    "size": len(data_url),
-                                }
-                            )
-                        )
-                    else:
-                        await websocket.send_text(
-                            json.dumps({"type": "error", "error": "Empty image."})
-                        )
-            elif message["type"] == "interrupt":
-                await manager.interrupt(session_id)
-            elif message["type"] == "set_persona":
-                persona = str(message.get("persona") or "joi").lower()
-                if persona not in {"joi", "officer_k", "officer_j"}:
-                    await websocket.send_text(
-                        json.dumps({"type": "error", "error": f"Unknown persona: {persona}"})
-                    )
-                else:
-                    manager.persona[session_id] = persona
-                    await websocket.send_text(
-                        json.dumps({"type": "client_info", "info": "persona_set", "persona": persona})
-                    )
-                    await manager.send_persona_mood_update(session_id)
+            raw = await websocket.receive()
+            if raw["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(raw.get("code") or 1000)
+
+            # Binary frames carry raw little-endian int16 PCM and skip the
+            # JSON int-array decode entirely; text frames remain the control
+            # channel (and the legacy JSON audio fallback).
+            pcm_frame = raw.get("bytes")
+            if pcm_frame is not None:
+                await manager.send_audio(session_id, pcm_frame)
+                continue
+
+            text_data = raw.get("text")
+            if text_data is None:
+                continue
+            try:
+                message = _CLIENT_MESSAGE_DECODER.decode(text_data)
+            except msgspec.DecodeError as exc:
+                # DecodeError is the base class: it covers syntactically
+                # invalid JSON as well as schema mismatches (ValidationError).
+                logger.warning("Rejected client message: %s", exc)
+                continue
+
+            await _MESSAGE_HANDLERS[type(message)](
+                manager, websocket, session_id, message, image_buffers
+            )
 
     except WebSocketDisconnect:
+        pass
+    finally:
+        # Whatever ends the loop — clean disconnect or an unexpected
+        # exception — the session context and its worker tasks must be
+        # torn down, or they leak for the life of the process.
         await manager.disconnect(session_id)
 
 
+@app.post("/did/webhook")
+async def did_webhook(payload: dict[str, Any]) -> dict[str, str]:
+    """Receive D-ID talk completion callbacks and resolve pending waits."""
+    service = manager._did_service
+    consumed = bool(service is not None and service.notify_webhook(payload))
+    return {"status": "ok" if consumed else "ignored"}
+
+
 @app.get("/")
 async def root() -> dict[str, str]:
     """Lightweight health endpoint for service discovery."""
@@ -1479,6 +1875,12 @@ if __name__ == "__main__":
         app,
         host="0.0.0.0",
         port=8000,
+        # libuv-backed loop; markedly faster task/IO scheduling for the
+        # high-frequency audio frame workload than the stdlib selector loop.
+        loop="uvloop",
+        # C HTTP parser from uvicorn[standard]; the pure-Python h11 parser is
+        # noticeably slower for the session/status JSON endpoints.
+        http="httptools",
         # Increased WebSocket frame size to comfortably handle image data URLs.
         ws_max_size=16 * 1024 * 1024,
     )
@@ -3,12 +3,16 @@ from __future__ import annotations
 
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class SessionCreateRequest(BaseModel):
     """Incoming payload for creating a new orchestration session."""
 
+    # Body parsing happens on every POST; dropping unknown keys in the Rust
+    # core is cheaper than collecting them for a validation error.
+    model_config = ConfigDict(extra="ignore")
+
     prompt: str = Field(..., description="User prompt or transcript driving the session")
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Arbitrary client metadata")
 
@@ -26,3 +30,9 @@ class SessionStatusResponse(BaseModel):
     session_id: str
     status: str
     details: Optional[Dict[str, Any]] = None
+
+
+# Module-level adapters: dump_json() emits response bytes straight from the
+# Rust core, skipping jsonable_encoder when handlers serialize these models.
+SESSION_RESPONSE_TA = TypeAdapter(SessionResponse)
+SESSION_STATUS_TA = TypeAdapter(SessionStatusResponse)
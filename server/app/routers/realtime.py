@@ -14,4 +14,7 @@ async def realtime_voice_gateway(websocket: WebSocket) -> None:
     bidirectional streaming of audio frames.
     """
 
+    # Closing before accept() rejects during the HTTP upgrade itself (Starlette
+    # translates it to a 403 handshake response), so no WebSocket state machine
+    # is ever spun up for the unimplemented endpoint.
     await websocket.close(code=4404)
@@ -1,14 +1,25 @@
 """Session management endpoints for the orchestrator."""
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, Response
 
 from ..models import schemas
 
 router = APIRouter(prefix="/sessions", tags=["sessions"])
 
+# Returning a prebuilt Response skips the HTTPException path entirely
+# (exception raise/catch, handler dispatch and per-request JSON encoding);
+# the 501 bodies are constant, so they are encoded once at import.
+_CREATE_NOT_IMPL_BODY = orjson.dumps({"detail": "Session creation not implemented yet"})
+_STATUS_NOT_IMPL_BODY = orjson.dumps({"detail": "Session status lookup not implemented yet"})
 
-@router.post("/", response_model=schemas.SessionResponse)
+
+# The return annotations exist for the OpenAPI schema. FastAPI also infers
+# response_model from them, but that validator never runs here: returning a
+# prebuilt Response bypasses response-model validation and re-serialization
+# entirely.
+@router.post("/")
 async def create_session(payload: schemas.SessionCreateRequest) -> schemas.SessionResponse:
     """Create a new orchestration session stub.
 
@@ -16,11 +27,11 @@ async def create_session(payload: schemas.SessionCreateRequest) -> schemas.Sessi
     to decide which agents and tools to invoke.
     """
 
-    raise HTTPException(status_code=501, detail="Session creation not implemented yet")
+    return Response(content=_CREATE_NOT_IMPL_BODY, status_code=501, media_type="application/json")
 
 
-@router.get("/{session_id}", response_model=schemas.SessionStatusResponse)
+@router.get("/{session_id}")
 async def get_session_status(session_id: str) -> schemas.SessionStatusResponse:
     """Return the current status for the requested session."""
 
-    raise HTTPException(status_code=501, detail="Session status lookup not implemented yet")
+    return Response(content=_STATUS_NOT_IMPL_BODY, status_code=501, media_type="application/json")
@@ -1,5 +1,6 @@
 import asyncio
-import base64
+import contextlib
+import functools
 import os
 from pathlib import Path
 from typing import Literal, Union
@@ -21,6 +22,12 @@ from agents import (
 
 from dotenv import load_dotenv
 
+try:
+    # SIMD-accelerated base64; screenshots are hundreds of KB per encode.
+    from pybase64 import b64encode as _b64encode
+except ImportError:  # pragma: no cover - stdlib fallback
+    from base64 import b64encode as _b64encode
+
 load_dotenv()
 
 # Uncomment to see very verbose logs
@@ -61,17 +68,31 @@ Return a clear, informative summary of what you found.
 """
 
 
+# Agent construction re-validates tool schemas and model settings, so build
+# the fixed parts once at import; each call clones in a fresh ComputerTool
+# (the only per-call piece) for the price of a shallow dataclass copy.
+_ADVICEHUB_AGENT = Agent(
+    name="AdviceHub Researcher",
+    instructions=ADVICEHUB_AGENT_INSTRUCTIONS,
+    tools=[],
+    # Use the computer using model, and set truncation to auto because its required
+    model="computer-use-preview",
+    model_settings=ModelSettings(truncation="auto"),
+)
+
+_BROWSE_AGENT = Agent(
+    name="Web Browser",
+    instructions=GENERIC_BROWSE_AGENT_INSTRUCTIONS,
+    tools=[],
+    model="computer-use-preview",
+    model_settings=ModelSettings(truncation="auto"),
+)
+
+
 async def main():
     async with LocalPlaywrightComputer(start_url="https://advicehub.ai/") as computer:
-        with trace("Computer use example"):
-            agent = Agent(
-                name="Browser user",
-                instructions=ADVICEHUB_AGENT_INSTRUCTIONS,
-                tools=[ComputerTool(computer)],
-                # Use the computer using model, and set truncation to auto because its required
-                model="computer-use-preview",
-                model_settings=ModelSettings(truncation="auto"),
-            )
+        with _maybe_trace("Computer use example"):
+            agent = _ADVICEHUB_AGENT.clone(tools=[ComputerTool(computer)])
             demo_query = "Mayank"
             result = await Runner.run(
                 agent,
@@ -110,8 +131,55 @@ CUA_KEY_TO_PLAYWRIGHT_KEY = {
 }
 
 
+def _build_key_table() -> dict[str, str]:
+    """Extend the CUA key map with title/upper-case spellings.
+
+    The model usually emits one of these three casings, so the hot lookup
+    hits directly without a per-key .lower() allocation.
+    """
+    table = dict(CUA_KEY_TO_PLAYWRIGHT_KEY)
+    for key, mapped in CUA_KEY_TO_PLAYWRIGHT_KEY.items():
+        table.setdefault(key.title(), mapped)
+        table.setdefault(key.upper(), mapped)
+    return table
+
+
+_KEY_TABLE = _build_key_table()
+
+
+def _map_key(key: str) -> str:
+    mapped = _KEY_TABLE.get(key)
+    if mapped is None:
+        mapped = CUA_KEY_TO_PLAYWRIGHT_KEY.get(key.lower(), key)
+    return mapped
+
+
+# Trim Chromium background work that an automated, screenshot-driven session
+# never benefits from: GPU compositing, extensions, translate prompts, sync,
+# first-run UI and speculative networking all cost startup time and steady-state
+# CPU without changing what the agent sees.
+_HEADLESS_LAUNCH_ARGS = [
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-translate",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+    "--disable-features=Translate,BackForwardCache,AcceptCHFrame,MediaRouter,OptimizationHints",
+    "--disable-ipc-flooding-protection",
+]
+
+
+@functools.cache
 def _env_flag(name: str, *, default: bool) -> bool:
-    """Return True if the environment flag is set to a truthy value."""
+    """Return True if the environment flag is set to a truthy value.
+
+    Cached: environment variables are fixed at process start, so each
+    flag is read and parsed once.
+    """
 
     raw = os.getenv(name)
     if raw is None:
@@ -121,8 +189,70 @@ def _env_flag(name: str, *, default: bool) -> bool:
     return normalized in {"1", "true", "yes", "on"}
 
 
+def _maybe_trace(workflow_name: str):
+    """Return a tracing span, or a no-op context when tracing is disabled.
+
+    Span export adds per-turn overhead across a run of dozens of CUA turns,
+    so production traffic opts in via COMPUTER_USE_TRACE.
+    """
+    if _env_flag("COMPUTER_USE_TRACE", default=False):
+        return trace(workflow_name)
+    return contextlib.nullcontext()
+
+
+class _PlaywrightPool:
+    """Shared Playwright driver and Chromium process for automation calls.
+
+    Launching Chromium costs seconds per call; the pool starts it once and
+    hands each request its own isolated BrowserContext instead. The first
+    launch fixes the headless/args configuration for the process lifetime.
+    """
+
+    def __init__(self) -> None:
+        self._playwright: Union[Playwright, None] = None
+        self._browser: Union[Browser, None] = None
+        self._lock = asyncio.Lock()
+
+    async def playwright(self) -> Playwright:
+        async with self._lock:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            return self._playwright
+
+    async def acquire_browser(self, *, headless: bool, launch_args: list[str]) -> Browser:
+        async with self._lock:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            if self._browser is None or not self._browser.is_connected():
+                self._browser = await self._playwright.chromium.launch(
+                    headless=headless,
+                    args=launch_args,
+                )
+            return self._browser
+
+    async def aclose(self) -> None:
+        async with self._lock:
+            if self._browser is not None:
+                try:
+                    await self._browser.close()
+                except Exception:
+                    pass
+                self._browser = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+
+_BROWSER_POOL = _PlaywrightPool()
+
+
+@functools.cache
 def _env_int(name: str, *, default: int) -> int:
-    """Return the integer value stored in an environment variable or fallback."""
+    """Return the integer value stored in an environment variable or fallback.
+
+    Cached: environment variables are fixed at process start, so each
+    value is read and parsed once.
+    """
 
     raw = os.getenv(name)
     if raw is None:
@@ -148,7 +278,12 @@ class LocalPlaywrightComputer(AsyncComputer):
         self._browser: Union[Browser, None] = None
         self._context: Union[BrowserContext, None] = None
         self._page: Union[Page, None] = None
+        self._owns_browser = False
         self._start_url = start_url
+        # Screenshot cache: mutating actions mark the page dirty; clean turns
+        # reuse the previous capture instead of re-encoding a PNG.
+        self._dirty = True
+        self._last_shot: Union[str, None] = None
 
         headless_default = _env_flag("PLAYWRIGHT_HEADLESS", default=True)
         self._headless = headless if headless is not None else headless_default
@@ -164,39 +299,52 @@ class LocalPlaywrightComputer(AsyncComputer):
 
     async def _get_browser_context_and_page(self) -> tuple[Browser, BrowserContext, Page]:
         width, height = self.dimensions
-        launch_args = [f"--window-size={width},{height}"]
+        launch_args = [f"--window-size={width},{height}", *_HEADLESS_LAUNCH_ARGS]
 
         if self._user_data_dir is not None:
+            # Persistent profiles need a dedicated browser process; only the
+            # Playwright driver itself is shared.
             context = await self.playwright.chromium.launch_persistent_context(
                 str(self._user_data_dir),
                 headless=self._headless,
                 args=launch_args,
             )
             browser = context.browser
+            self._owns_browser = True
         else:
-            browser = await self.playwright.chromium.launch(
+            browser = await _BROWSER_POOL.acquire_browser(
                 headless=self._headless,
-                args=launch_args,
+                launch_args=launch_args,
             )
             context = await browser.new_context()
+            self._owns_browser = False
 
         page = next((p for p in context.pages if not p.is_closed()), None)
         if page is None:
             page = await context.new_page()
 
-        await page.set_viewport_size({"width": width, "height": height})
+        async def _initial_goto() -> None:
+            try:
+                # "commit" returns once navigation is committed; the agent's
+                # first screenshot happens after its own turn delay, so there
+                # is no need to block startup on subresource loading.
+                await page.goto(self._start_url, wait_until="commit")
+            except Exception:
+                # The computer-use model can still recover if the initial navigation fails;
+                # log-less environments fall back to starting from a blank tab.
+                pass
 
-        try:
-            await page.goto(self._start_url, wait_until="domcontentloaded")
-        except Exception:
-            # The computer-use model can still recover if the initial navigation fails;
-            # log-less environments fall back to starting from a blank tab.
-            pass
+        self._dirty = True
+        await asyncio.gather(
+            page.set_viewport_size({"width": width, "height": height}),
+            _initial_goto(),
+        )
         return browser, context, page
 
     async def __aenter__(self):
-        # Start Playwright and call the subclass hook for getting browser/page
-        self._playwright = await async_playwright().start()
+        # The driver and (for ephemeral contexts) the browser come from the
+        # shared pool; each call only pays for its own context and page.
+        self._playwright = await _BROWSER_POOL.playwright()
         self._browser, self._context, self._page = await self._get_browser_context_and_page()
         return self
 
@@ -206,13 +354,14 @@ class LocalPlaywrightComputer(AsyncComputer):
                 await self._context.close()
             except Exception:
                 pass
-        if self._browser:
+        if self._owns_browser and self._browser:
             try:
                 await self._browser.close()
             except Exception:
                 pass
-        if self._playwright:
-            await self._playwright.stop()
+        self._browser = None
+        self._context = None
+        self._page = None
 
     @property
     def playwright(self) -> Playwright:
@@ -243,10 +392,24 @@ class LocalPlaywrightComputer(AsyncComputer):
         return (1024, 768)
 
     async def screenshot(self) -> str:
-        """Capture only the viewport (not full_page) and return raw base64."""
+        """Capture only the viewport (not full_page) and return raw base64.
+
+        Every action marks the cache dirty — even move() (hover states)
+        and wait() (in-flight loads landing) — so only back-to-back
+        screenshots with nothing in between reuse the cached capture,
+        skipping the Playwright round-trip plus PNG/base64 encode.
+        """
+        if not self._dirty and self._last_shot is not None:
+            return self._last_shot
         png_bytes = await self.page.screenshot(full_page=False)
-        # The agents SDK wraps this value in a data URL, so we only return the base64 payload here.
-        return base64.b64encode(png_bytes).decode("ascii")
+        # The agents SDK wraps this value in a data URL, so we only return the
+        # base64 payload here. Encoding a few hundred KB inline would stall the
+        # event loop, so it runs on a worker thread.
+        self._last_shot = await asyncio.to_thread(
+            lambda: _b64encode(png_bytes).decode("ascii")
+        )
+        self._dirty = False
+        return self._last_shot
 
     async def click(self, x: int, y: int, button: Button = "left") -> None:
         playwright_button: Literal["left", "middle", "right"] = "left"
@@ -256,38 +419,61 @@ class LocalPlaywrightComputer(AsyncComputer):
             playwright_button = button  # type: ignore
 
         await self.page.mouse.click(x, y, button=playwright_button)
+        self._dirty = True
 
     async def double_click(self, x: int, y: int) -> None:
         await self.page.mouse.dblclick(x, y)
+        self._dirty = True
 
     async def scroll(self, x: int, y: int, scroll_x: int, scroll_y: int) -> None:
         await self.page.mouse.move(x, y)
         await self.page.mouse.wheel(delta_x=scroll_x, delta_y=scroll_y)
+        self._dirty = True
 
     async def type(self, text: str) -> None:
         await self.page.keyboard.type(text)
+        self._dirty = True
 
     async def wait(self) -> None:
         await asyncio.sleep(2)
+        # The model waits precisely because it expects the page to change
+        # (navigation settling, scripted content loading), so the cached
+        # capture must not survive the pause.
+        self._dirty = True
 
     async def move(self, x: int, y: int) -> None:
         await self.page.mouse.move(x, y)
+        # Hovering changes what the page renders (dropdowns, tooltips,
+        # highlight states) — often the very thing the model moved the
+        # mouse to inspect — so the cached capture is no longer accurate.
+        self._dirty = True
 
     async def keypress(self, keys: list[str]) -> None:
-        mapped_keys = [CUA_KEY_TO_PLAYWRIGHT_KEY.get(key.lower(), key) for key in keys]
-        for key in mapped_keys:
-            await self.page.keyboard.down(key)
-        for key in reversed(mapped_keys):
-            await self.page.keyboard.up(key)
+        if not keys:
+            return
+        mapped_keys = [_map_key(key) for key in keys]
+        if len(mapped_keys) == 1:
+            await self.page.keyboard.press(mapped_keys[0])
+        else:
+            # Playwright takes "+"-joined chords as a single press, collapsing
+            # the paired down/up round-trips per key into one CDP call with
+            # identical press/release ordering.
+            await self.page.keyboard.press("+".join(mapped_keys))
+        self._dirty = True
 
     async def drag(self, path: list[tuple[int, int]]) -> None:
         if not path:
             return
         await self.page.mouse.move(path[0][0], path[0][1])
         await self.page.mouse.down()
-        for px, py in path[1:]:
-            await self.page.mouse.move(px, py)
+        # Queue the intermediate moves back-to-back and await them together;
+        # an N-point drag pays roughly one round-trip instead of N. Task
+        # creation order keeps the CDP messages in path order.
+        moves = [asyncio.ensure_future(self.page.mouse.move(px, py)) for px, py in path[1:]]
+        if moves:
+            await asyncio.gather(*moves)
         await self.page.mouse.up()
+        self._dirty = True
 
 
 async def browse_query(query: str, url: str | None = None) -> str:
@@ -303,14 +489,8 @@ async def browse_query(query: str, url: str | None = None) -> str:
     start_url = url.strip() if url else "https://www.google.com"
 
     async with LocalPlaywrightComputer(start_url=start_url) as computer:
-        with trace("Generic browse query"):
-            agent = Agent(
-                name="Web Browser",
-                instructions=GENERIC_BROWSE_AGENT_INSTRUCTIONS,
-                tools=[ComputerTool(computer)],
-                model="computer-use-preview",
-                model_settings=ModelSettings(truncation="auto"),
-            )
+        with _maybe_trace("Generic browse query"):
+            agent = _BROWSE_AGENT.clone(tools=[ComputerTool(computer)])
             try:
                 if url:
                     task_prompt = (
@@ -350,14 +530,8 @@ async def search_advicehub(query: str) -> str:
         return "I need the expert's name to search on advicehub.ai."
 
     async with LocalPlaywrightComputer(start_url="https://advicehub.ai/") as computer:
-        with trace("Search advicehub.ai"):
-            agent = Agent(
-                name="AdviceHub Researcher",
-                instructions=ADVICEHUB_AGENT_INSTRUCTIONS,
-                tools=[ComputerTool(computer)],
-                model="computer-use-preview",
-                model_settings=ModelSettings(truncation="auto"),
-            )
+        with _maybe_trace("Search advicehub.ai"):
+            agent = _ADVICEHUB_AGENT.clone(tools=[ComputerTool(computer)])
             try:
                 task_prompt = (
                     f"Search for '{normalized_query}' on https://advicehub.ai/ and summarize what you find "
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+import base64
+import io
+import logging
+import mimetypes
+import os
+import random
+import struct
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
 import httpx
+import orjson
 
 # Support both package and script import contexts for settings
 try:
@@ -17,38 +26,155 @@ except Exception:  # pragma: no cover - fallback for script-style execution
         from config import settings
 
 
-API_BASE = "https://api.d-id.com"
+logger = logging.getLogger(__name__)
 
+API_BASE = "https://api.d-id.com"
 
-def _pcm16le_to_wav(pcm: bytes, sample_rate: int = 24_000, channels: int = 1) -> bytes:
+# Terminal talk states never change again, so their status responses can be
+# cached for the talk's lifetime; anything else is only fresh briefly.
+# DidTalkResult.status always holds the lowercased canonical form, so these
+# are checked by plain membership with no per-check normalization.
+_STATUS_TERMINAL_OK = frozenset({"done", "complete", "succeeded"})
+_STATUS_TERMINAL_ERR = frozenset({"error", "failed"})
+_TERMINAL_STATUSES = _STATUS_TERMINAL_OK | _STATUS_TERMINAL_ERR
+_STATUS_CACHE_TTL = 0.5
+_STATUS_CACHE_MAX = 256
+
+
+# The full 44-byte RIFF/WAVE header as one compiled Struct; a single pack
+# call replaces the chain of per-field packs and byte concatenations.
+_WAV_STRUCT = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+def _wav_header(data_size: int, sample_rate: int = 24_000, channels: int = 1) -> bytes:
+    """Build the 44-byte RIFF/WAVE header for a PCM 16-bit LE payload."""
+    return _WAV_STRUCT.pack(
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM
+        channels,
+        sample_rate,
+        sample_rate * channels * 2,  # byte rate
+        channels * 2,  # block align
+        16,  # bits per sample
+        b"data",
+        data_size,
+    )
+
+
+def _pcm16le_to_wav(pcm: bytes, sample_rate: int = 24_000, channels: int = 1) -> bytearray:
     """Wrap raw PCM 16-bit little-endian mono data into a minimal WAV container.
 
     D-ID accepts audio uploads; wrapping to WAV ensures content-type/audio container is explicit.
+    Returns the working bytearray directly — it is bytes-like everywhere the
+    result is consumed, and converting would copy the whole payload again.
+    """
+    buf = bytearray(_WAV_STRUCT.size + len(pcm))
+    _WAV_STRUCT.pack_into(
+        buf,
+        0,
+        b"RIFF",
+        36 + len(pcm),
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        channels,
+        sample_rate,
+        sample_rate * channels * 2,
+        channels * 2,
+        16,
+        b"data",
+        len(pcm),
+    )
+    buf[_WAV_STRUCT.size:] = pcm
+    return buf
+
+
+class _WavStream(io.RawIOBase):
+    """Seekable file-like view of header + PCM without concatenating them.
+
+    httpx reads this in chunks when building the multipart body, so a long
+    turn's audio is never duplicated into a second `header + pcm` bytes
+    object; only the chunk currently on the wire is materialized.
     """
-    import struct
-
-    byte_rate = sample_rate * channels * 2
-    block_align = channels * 2
-    data_size = len(pcm)
-    fmt_chunk_size = 16
-    riff_chunk_size = 4 + (8 + fmt_chunk_size) + (8 + data_size)
-
-    header = b"RIFF" + struct.pack("<I", riff_chunk_size) + b"WAVE"
-    # fmt chunk
-    header += b"fmt " + struct.pack("<IHHIIHH", fmt_chunk_size, 1, channels, sample_rate, byte_rate, block_align, 16)
-    # data chunk
-    header += b"data" + struct.pack("<I", data_size)
-    return header + pcm
 
+    def __init__(self, pcm: bytes, sample_rate: int = 24_000, channels: int = 1):
+        self._header = _wav_header(len(pcm), sample_rate, channels)
+        self._pcm = memoryview(pcm)
+        self._pos = 0
+        self._size = len(self._header) + len(pcm)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        # httpx measures content-length via seek/tell, and rewinds on retries.
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self._size + offset
+        else:
+            raise ValueError(f"invalid whence: {whence}")
+        self._pos = max(0, min(pos, self._size))
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._size - self._pos
+        end = min(self._pos + size, self._size)
+        chunks = []
+        header_len = len(self._header)
+        if self._pos < header_len:
+            chunks.append(self._header[self._pos:min(end, header_len)])
+        if end > header_len:
+            start = max(self._pos - header_len, 0)
+            chunks.append(bytes(self._pcm[start:end - header_len]))
+        self._pos = end
+        return b"".join(chunks)
+
+
+class DidTalkResult(NamedTuple):
+    """Terminal-or-interim talk state; tuple-backed for cheap per-poll results."""
 
-@dataclass
-class DidTalkResult:
     talk_id: str
     status: str
-    result_url: Optional[str]
+    result_url: Optional[str] = None
     error: Optional[str] = None
 
 
+def _parse_talk(talk_id: str, data: dict) -> DidTalkResult:
+    """Build a DidTalkResult from a talk payload (API response or webhook).
+
+    One static extractor instead of repeating the get-or-get fallback chains
+    per call site; the nested result lookup only runs when the flat
+    result_url key is absent, so the common poll avoids the temporary dict.
+    """
+    status = data.get("status") or data.get("state")
+    result_url = data.get("result_url")
+    if result_url is None:
+        nested = data.get("result")
+        if nested:
+            result_url = nested.get("url")
+    return DidTalkResult(
+        talk_id=talk_id,
+        status=str(status).lower() if status else "unknown",
+        result_url=result_url,
+        error=data.get("error") or None,
+    )
+
+
 class DIDTalksService:
     def __init__(self, api_key: Optional[str] = None, webhook: Optional[str] = None):
         raw_key = api_key or settings.did_api_key
@@ -59,70 +185,196 @@ class DIDTalksService:
             user, pwd = raw_key.split(":", 1)
         else:
             user, pwd = raw_key, ""
-        self._auth = (user, pwd)
+        # Credentials are fixed for the service lifetime, so the Basic header
+        # is encoded once here instead of running httpx's auth flow per request.
+        self._auth_header = "Basic " + base64.b64encode(f"{user}:{pwd}".encode()).decode()
         self._default_webhook = webhook or settings.did_webhook_url
+        # One pooled client for the service lifetime: keep-alive + HTTP/2
+        # means talks after the first skip TCP/TLS setup entirely.
+        self._client = httpx.AsyncClient(
+            base_url=API_BASE,
+            headers=self._base_headers(),
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+        # Futures keyed by talk id, resolved by D-ID webhook callbacks so the
+        # happy path skips the get_talk poll loop entirely. Only talks whose
+        # creation payload actually carried a webhook are tracked here — the
+        # multipart (PCM) path attaches none, so waiting on a callback for it
+        # would stall for the full max_wait before polling.
+        self._pending: dict[str, asyncio.Future[DidTalkResult]] = {}
+        self._webhook_talks: set[str] = set()
+        # One poll loop per talk id, shared by concurrent waiters so a second
+        # consumer (e.g. a UI reconnect) does not double the request rate.
+        self._inflight: dict[str, asyncio.Task[DidTalkResult]] = {}
+        # Short-TTL status cache plus per-talk fetch locks so bursts of
+        # status checks collapse into one request.
+        self._status_cache: dict[str, tuple[float, DidTalkResult]] = {}
+        self._status_locks: dict[str, asyncio.Lock] = {}
+
+    async def aclose(self) -> None:
+        """Release the pooled HTTP client (call on app shutdown)."""
+        await self._client.aclose()
 
     def _base_headers(self) -> dict[str, str]:
-        # D-ID prefers Basic auth with API key as username and empty password.
-        # We'll pass auth=(api_key, "") to httpx and keep basic JSON defaults here.
-        return {"Accept": "application/json"}
+        # D-ID prefers Basic auth with API key as username and empty password;
+        # the precomputed header rides on every request via client defaults.
+        return {"Accept": "application/json", "Authorization": self._auth_header}
 
     async def create_talk_multipart(
         self,
         *,
         image_bytes: bytes,
         image_filename: str,
-        audio_wav_bytes: bytes,
+        audio_wav_bytes: bytes | io.RawIOBase,
         timeout: float = 30.0,
     ) -> str:
         """Create a talk by uploading image + audio as multipart. Returns talk id."""
         files = {
-            "source_image": (image_filename, image_bytes, "image/jpeg" if image_filename.endswith(".jpeg") or image_filename.endswith(".jpg") else "image/png"),
+            "source_image": (image_filename, image_bytes, _image_mime(image_filename)),
             "audio": ("audio.wav", audio_wav_bytes, "audio/wav"),
         }
-        async with httpx.AsyncClient(
-            base_url=API_BASE,
-            headers=self._base_headers(),
-            timeout=timeout,
-            auth=self._auth,
-        ) as client:
-            resp = await client.post("/talks", files=files)
-            resp.raise_for_status()
-            data = resp.json()
-            talk_id = data.get("id") or data.get("talk_id")
-            if not talk_id:
-                raise RuntimeError(f"Unexpected response from D-ID: {data}")
-            return str(talk_id)
+        resp = await self._client.post("/talks", files=files, timeout=timeout)
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
+        talk_id = data.get("id") or data.get("talk_id")
+        if not talk_id:
+            raise RuntimeError(f"Unexpected response from D-ID: {data}")
+        return str(talk_id)
+
+    def _cached_status(self, talk_id: str) -> Optional[DidTalkResult]:
+        cached = self._status_cache.get(talk_id)
+        if cached is None:
+            return None
+        fetched_at, result = cached
+        if result.status in _TERMINAL_STATUSES:
+            return result
+        if time.monotonic() - fetched_at < _STATUS_CACHE_TTL:
+            return result
+        return None
 
     async def get_talk(self, talk_id: str, timeout: float = 30.0) -> DidTalkResult:
-        async with httpx.AsyncClient(
-            base_url=API_BASE,
-            headers=self._base_headers(),
-            timeout=timeout,
-            auth=self._auth,
-        ) as client:
-            resp = await client.get(f"/talks/{talk_id}")
-            resp.raise_for_status()
-            data = resp.json()
-            status = str(data.get("status") or data.get("state") or "unknown")
-            result_url = data.get("result_url") or (data.get("result") or {}).get("url")
-            error = data.get("error") or None
-            return DidTalkResult(talk_id=talk_id, status=status, result_url=result_url, error=error)
+        result = self._cached_status(talk_id)
+        if result is not None:
+            return result
+        # Per-talk lock: concurrent misses wait for one fetch instead of
+        # stampeding the API with identical requests.
+        lock = self._status_locks.setdefault(talk_id, asyncio.Lock())
+        async with lock:
+            result = self._cached_status(talk_id)
+            if result is not None:
+                return result
+            result = await self._fetch_talk(talk_id, timeout=timeout)
+            if len(self._status_cache) >= _STATUS_CACHE_MAX:
+                self._status_cache.pop(next(iter(self._status_cache)))
+            self._status_cache[talk_id] = (time.monotonic(), result)
+        if result.status in _TERMINAL_STATUSES:
+            self._status_locks.pop(talk_id, None)
+        return result
+
+    async def _fetch_talk(self, talk_id: str, timeout: float = 30.0) -> DidTalkResult:
+        resp = await self._client.get(f"/talks/{talk_id}", timeout=timeout)
+        resp.raise_for_status()
+        return _parse_talk(talk_id, orjson.loads(resp.content))
+
+    def notify_webhook(self, payload: dict) -> bool:
+        """Resolve a pending wait from a D-ID webhook callback body.
+
+        Returns True when a waiter (current or future) will consume the result.
+        Only talk ids recorded in _webhook_talks at creation time are accepted:
+        the webhook route is unauthenticated, so anything else would let a
+        third party pre-resolve a wait with a spoofed status/result_url (and
+        late or spoofed callbacks would park futures in _pending that nothing
+        ever cleans up).
+        """
+        talk_id = payload.get("id") or payload.get("talk_id")
+        if not talk_id:
+            return False
+        talk_id = str(talk_id)
+        if talk_id not in self._webhook_talks:
+            return False
+        result = _parse_talk(talk_id, payload)
+        future = self._pending.get(talk_id)
+        if future is None:
+            # Webhook raced ahead of wait_for_result; park the resolved
+            # future so the waiter picks it up when it arrives.
+            future = asyncio.get_running_loop().create_future()
+            self._pending[talk_id] = future
+        if future.done():
+            return False
+        future.set_result(result)
+        return True
 
     async def wait_for_result(self, talk_id: str, *, poll_interval: float = 1.0, max_wait: float = 120.0) -> DidTalkResult:
-        deadline = asyncio.get_event_loop().time() + max_wait
+        if talk_id in self._webhook_talks:
+            loop = asyncio.get_running_loop()
+            future = self._pending.setdefault(talk_id, loop.create_future())
+            try:
+                return await asyncio.wait_for(future, timeout=max_wait)
+            except asyncio.TimeoutError:
+                # Webhook never arrived (lost callback or misconfigured URL);
+                # fall back to polling as a safety net.
+                pass
+            finally:
+                self._pending.pop(talk_id, None)
+                self._webhook_talks.discard(talk_id)
+
+        # The webhook futures above already coalesce waiters; do the same for
+        # the polling path so concurrent waits share one get_talk loop.
+        task = self._inflight.get(talk_id)
+        if task is None:
+            task = asyncio.create_task(
+                self._poll_for_result(talk_id, poll_interval=poll_interval, max_wait=max_wait)
+            )
+            self._inflight[talk_id] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(talk_id, None))
+        # Shield: one waiter being cancelled must not tear the loop down
+        # under the remaining waiters.
+        return await asyncio.shield(task)
+
+    async def _poll_for_result(self, talk_id: str, *, poll_interval: float = 1.0, max_wait: float = 120.0) -> DidTalkResult:
+        # Truncated exponential backoff with jitter: a 2s talk completes within
+        # a couple of short polls, while a 90s talk costs a handful of requests
+        # instead of one per second. poll_interval now acts as a floor for the
+        # backoff cap so existing callers keep their worst-case gap.
+        max_delay = max(poll_interval, 4.0)
+        delay = 0.25
         last = None
-        while asyncio.get_event_loop().time() < deadline:
-            last = await self.get_talk(talk_id)
-            if last.status.lower() in {"done", "complete", "succeeded"}:
-                return last
-            if last.status.lower() in {"error", "failed"}:
-                return last
-            await asyncio.sleep(poll_interval)
-        # Timed out
-        if last is None:
-            return DidTalkResult(talk_id=talk_id, status="timeout", result_url=None, error="Timeout waiting for result")
-        return DidTalkResult(talk_id=talk_id, status="timeout", result_url=last.result_url, error="Timeout")
+        try:
+            # asyncio.timeout owns the deadline: when max_wait elapses it
+            # cancels whatever is in flight — sleep or HTTP request — so no
+            # per-iteration clock reads or remaining-time arithmetic needed.
+            async with asyncio.timeout(max_wait):
+                while True:
+                    try:
+                        polled = await self.get_talk(talk_id, timeout=10.0)
+                    except httpx.HTTPStatusError as exc:
+                        if exc.response.status_code != 429:
+                            raise
+                        # Rate limited: back off hard and honor Retry-After if given.
+                        delay = min(max_delay, delay * 4)
+                        retry_after = exc.response.headers.get("Retry-After")
+                        if retry_after:
+                            try:
+                                delay = max(delay, float(retry_after))
+                            except ValueError:
+                                pass
+                        await asyncio.sleep(delay)
+                        continue
+                    if last is not None and polled.status != last.status:
+                        # Progress (e.g. created -> started): the job is moving,
+                        # so drop back to tight polling for the next transition.
+                        delay = 0.25
+                    last = polled
+                    if last.status in _TERMINAL_STATUSES:
+                        return last
+                    await asyncio.sleep(delay + random.uniform(0, delay * 0.1))
+                    delay = min(max_delay, delay * 2)
+        except TimeoutError:
+            if last is None:
+                return DidTalkResult(talk_id=talk_id, status="timeout", result_url=None, error="Timeout waiting for result")
+            return DidTalkResult(talk_id=talk_id, status="timeout", result_url=last.result_url, error="Timeout")
 
     async def generate_talk_from_pcm(
         self,
@@ -131,12 +383,17 @@ class DIDTalksService:
         sample_rate: int,
         persona_image_path: Path,
     ) -> DidTalkResult:
-        image_bytes = persona_image_path.read_bytes()
-        wav = _pcm16le_to_wav(pcm_bytes, sample_rate=sample_rate)
+        # Kick off the (possibly cold) image read first so its disk I/O
+        # overlaps the WAV assembly below; warm reads resolve from cache.
+        image_task = asyncio.ensure_future(_persona_image_bytes(persona_image_path))
+        # Stream header + PCM back-to-back instead of allocating a combined
+        # `header + pcm` copy of the whole turn's audio.
+        wav_stream = _WavStream(pcm_bytes, sample_rate=sample_rate)
+        image_bytes = await image_task
         talk_id = await self.create_talk_multipart(
             image_bytes=image_bytes,
             image_filename=persona_image_path.name,
-            audio_wav_bytes=wav,
+            audio_wav_bytes=wav_stream,
         )
         return await self.wait_for_result(talk_id)
 
@@ -168,35 +425,31 @@ class DIDTalksService:
             # According to example provided, webhook lives under script
             assert isinstance(payload["script"], dict)
             payload["script"]["webhook"] = webhook_url
-        import logging
-        logger = logging.getLogger(__name__)
 
-        logger.info(f"Sending D-ID talk creation request: {payload}")
+        logger.info("Sending D-ID talk creation request: %.300s", payload)
 
-        async with httpx.AsyncClient(
-            base_url=API_BASE,
-            headers={**self._base_headers(), "Content-Type": "application/json"},
-            timeout=timeout,
-            auth=self._auth,
-        ) as client:
-            resp = await client.post("/talks", json=payload)
-            logger.info(f"D-ID API response status: {resp.status_code}")
+        resp = await self._client.post("/talks", json=payload, timeout=timeout)
+        logger.info("D-ID API response status: %s", resp.status_code)
 
-            try:
-                resp.raise_for_status()
-                data = resp.json()
-                logger.info(f"D-ID API response data: {data}")
+        try:
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
+            logger.info("D-ID API response data: %.300s", data)
 
-                talk_id = data.get("id") or data.get("talk_id")
-                if not talk_id:
-                    logger.error(f"No talk_id in D-ID response: {data}")
-                    raise RuntimeError(f"Unexpected response from D-ID: {data}")
+            talk_id = data.get("id") or data.get("talk_id")
+            if not talk_id:
+                logger.error("No talk_id in D-ID response: %s", data)
+                raise RuntimeError(f"Unexpected response from D-ID: {data}")
 
-                logger.info(f"Successfully created D-ID talk with ID: {talk_id}")
-                return str(talk_id)
-            except httpx.HTTPStatusError as e:
-                logger.error(f"D-ID API HTTP error: {e.response.status_code} - {e.response.text}")
-                raise
+            if webhook_url:
+                # Mark the talk as webhook-backed so wait_for_result knows a
+                # callback is actually coming before parking on the future.
+                self._webhook_talks.add(str(talk_id))
+            logger.info("Successfully created D-ID talk with ID: %s", talk_id)
+            return str(talk_id)
+        except httpx.HTTPStatusError as e:
+            logger.error("D-ID API HTTP error: %s - %.300s", e.response.status_code, e.response.text)
+            raise
 
     async def generate_talk_from_text(
         self,
@@ -206,50 +459,74 @@ class DIDTalksService:
         voice_id: str = "en-US-JennyNeural",
         webhook: Optional[str] = None,
     ) -> DidTalkResult:
-        import logging
-        logger = logging.getLogger(__name__)
-
-        logger.info(f"Starting D-ID talk generation: source_url={source_url[:50]}..., text_length={len(text)}, voice_id={voice_id}")
+        logger.info("Starting D-ID talk generation: source_url=%.50s..., text_length=%d, voice_id=%s", source_url, len(text), voice_id)
         talk_id = await self.create_talk_text(
             source_url=source_url,
             text=text,
             voice_id=voice_id,
             webhook=webhook,
         )
-        logger.info(f"D-ID talk created with ID: {talk_id}")
+        logger.info("D-ID talk created with ID: %s", talk_id)
 
         result = await self.wait_for_result(talk_id)
-        logger.info(f"D-ID talk {talk_id} completed with status: {result.status}")
+        logger.info("D-ID talk %s completed with status: %s", talk_id, result.status)
         return result
 
 
+@lru_cache(maxsize=8)
+def _image_mime(filename: str) -> str:
+    """Content type for an upload filename, resolved once per distinct name.
+
+    The persona set is three fixed files, so this replaces per-call suffix
+    checks with a cached lookup.
+    """
+    guessed, _ = mimetypes.guess_type(filename)
+    return guessed or "image/png"
+
+
+_PERSONA_IMAGE_CACHE: dict[Path, bytes] = {}
+
+
+async def _persona_image_bytes(path: Path) -> bytes:
+    """Read a persona image once; the assets are small, fixed files.
+
+    The cold read runs on a worker thread so a disk stall never blocks the
+    event loop; warm calls return the cached bytes without a thread hop.
+    """
+    data = _PERSONA_IMAGE_CACHE.get(path)
+    if data is None:
+        data = await asyncio.to_thread(path.read_bytes)
+        _PERSONA_IMAGE_CACHE[path] = data
+    return data
+
+
+# Persona images are fixed assets under web/public at the repo root; the
+# directory walk (this file: server/app/services/did_talks.py -> .../deckard)
+# and the key mapping are resolved once at import.
+_PUBLIC_DIR = Path(__file__).resolve().parents[3] / "web" / "public"
+_PERSONA_PATHS: dict[str, Path] = {
+    # New keys mapped to existing public assets
+    "joi": _PUBLIC_DIR / "joi.png",
+    "officer_k": _PUBLIC_DIR / "officer_k.png",
+    "officer_j": _PUBLIC_DIR / "officer_j.png",
+}
+
+
+@lru_cache(maxsize=8)
 def resolve_persona_image(persona: str) -> Path:
     """Map a short persona key to the repository's web/public image path."""
-    # This file: server/app/services/did_talks.py
-    here = Path(__file__).resolve()
-    repo_root = here.parents[3]  # .../deckard
-    public = repo_root / "web" / "public"
-    mapping = {
-        # New keys mapped to existing public assets
-        "joi": public / "joi.png",
-        "officer_k": public / "officer_k.png",
-        "officer_j": public / "officer_j.png"
-    }
-    key = persona.lower().strip()
-    if key not in mapping:
-        # default to joi
-        key = "joi"
-    path = mapping[key]
+    # Unknown personas default to joi; the existence check runs once per
+    # persona thanks to the cache.
+    path = _PERSONA_PATHS.get(persona.lower().strip(), _PERSONA_PATHS["joi"])
     if not path.exists():
         raise FileNotFoundError(f"Persona image not found: {path}")
     return path
 
 
+@lru_cache(maxsize=8)
 def resolve_persona_source_url(persona: str) -> Optional[str]:
-    import logging
-    import os
-    logger = logging.getLogger(__name__)
-
+    # Env vars are fixed at process start, so each persona's URL is resolved
+    # (and logged) once; repeat calls are a cache hit.
     key = persona.lower().strip()
     env_key = {
         "joi": "DID_SOURCE_URL_JOI",
@@ -258,13 +535,13 @@ def resolve_persona_source_url(persona: str) -> Optional[str]:
     }.get(key)
 
     if not env_key:
-        logger.warning(f"Unknown persona for source URL resolution: {persona}")
+        logger.warning("Unknown persona for source URL resolution: %s", persona)
         return None
 
     source_url = os.getenv(env_key)
     if source_url:
-        logger.info(f"Found source URL for persona {persona} ({env_key}): {source_url[:50]}...")
+        logger.info("Found source URL for persona %s (%s): %.50s...", persona, env_key, source_url)
     else:
-        logger.warning(f"No source URL configured for persona {persona} (env var {env_key} is empty)")
+        logger.warning("No source URL configured for persona %s (env var %s is empty)", persona, env_key)
 
     return source_url
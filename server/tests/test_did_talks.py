@@ -1,6 +1,7 @@
+import asyncio
 import struct
 
-from app.services.did_talks import _pcm16le_to_wav
+from app.services.did_talks import DidTalkResult, DIDTalksService, _pcm16le_to_wav
 
 
 def test_pcm_to_wav_header_and_size():
@@ -17,3 +18,81 @@ def test_pcm_to_wav_header_and_size():
     assert idx != -1
     (data_len,) = struct.unpack_from("<I", wav, idx + 4)
     assert data_len == len(samples)
+
+
+def _run(coro):  # noqa: ANN001
+    return asyncio.run(coro)
+
+
+def _make_service() -> DIDTalksService:
+    return DIDTalksService(api_key="user:pass", webhook="https://example.test/did/webhook")
+
+
+def test_webhook_resolves_parked_wait() -> None:
+    async def scenario():
+        service = _make_service()
+        try:
+            service._webhook_talks.add("tlk_1")
+            waiter = asyncio.create_task(service.wait_for_result("tlk_1", max_wait=5.0))
+            await asyncio.sleep(0.01)  # let the waiter park on the future
+            consumed = service.notify_webhook(
+                {"id": "tlk_1", "status": "done", "result_url": "https://d-id.test/v.mp4"}
+            )
+            result = await waiter
+            return consumed, result
+        finally:
+            await service.aclose()
+
+    consumed, result = _run(scenario())
+    assert consumed is True
+    assert result.status == "done"
+    assert result.result_url == "https://d-id.test/v.mp4"
+
+
+def test_wait_polls_when_no_webhook_registered() -> None:
+    async def scenario():
+        service = _make_service()
+        try:
+            statuses = iter(["started", "done"])
+
+            async def fake_fetch(talk_id, timeout=30.0):  # noqa: ANN001
+                return DidTalkResult(
+                    talk_id=talk_id, status=next(statuses), result_url="https://d-id.test/v.mp4"
+                )
+
+            service._fetch_talk = fake_fetch
+            # Webhook URL is configured but tlk_2 was never registered as
+            # webhook-backed (the PCM path), so this must poll immediately.
+            return await service.wait_for_result("tlk_2", poll_interval=0.01, max_wait=5.0)
+        finally:
+            await service.aclose()
+
+    result = _run(scenario())
+    assert result.status == "done"
+
+
+def test_concurrent_waiters_share_one_poll_loop() -> None:
+    async def scenario():
+        service = _make_service()
+        try:
+            calls = 0
+
+            async def fake_fetch(talk_id, timeout=30.0):  # noqa: ANN001
+                nonlocal calls
+                calls += 1
+                await asyncio.sleep(0.05)
+                return DidTalkResult(talk_id=talk_id, status="done", result_url="u")
+
+            service._fetch_talk = fake_fetch
+            first, second = await asyncio.gather(
+                service.wait_for_result("tlk_3", poll_interval=0.01, max_wait=5.0),
+                service.wait_for_result("tlk_3", poll_interval=0.01, max_wait=5.0),
+            )
+            return calls, first, second
+        finally:
+            await service.aclose()
+
+    calls, first, second = _run(scenario())
+    assert calls == 1
+    assert first == second
+    assert first.status == "done"
@@ -1,15 +1,27 @@
 from __future__ import annotations
 
 import asyncio
+from types import SimpleNamespace
 
 import pytest
 
 from app.ai_agents import sentiment_classifying
 
 
-class DummyResult:
-    def __init__(self, final_output: str | None):
+class DummyStreamedResult:
+    """Stand-in for RunResultStreaming with scripted text deltas."""
+
+    def __init__(self, final_output: str | None, deltas: tuple[str, ...] | None = None):
         self.final_output = final_output
+        self.cancelled = False
+        self._deltas = deltas if deltas is not None else ((final_output,) if final_output else ())
+
+    async def stream_events(self):
+        for delta in self._deltas:
+            yield SimpleNamespace(type="raw_response_event", data=SimpleNamespace(delta=delta))
+
+    def cancel(self) -> None:
+        self.cancelled = True
 
 
 def _run(coro):  # noqa: ANN001
@@ -17,36 +29,62 @@ def _run(coro):  # noqa: ANN001
 
 
 def test_classify_sentiment_uses_agent_when_available(monkeypatch: pytest.MonkeyPatch) -> None:
-    async def fake_run(*args, **kwargs):  # noqa: ANN001, ANN002
-        return DummyResult("positive")
+    def fake_run_streamed(*args, **kwargs):  # noqa: ANN001, ANN002
+        return DummyStreamedResult("positive")
 
-    monkeypatch.setattr(sentiment_classifying.Runner, "run", fake_run)
+    monkeypatch.setattr(sentiment_classifying.Runner, "run_streamed", fake_run_streamed)
     sentiment = _run(sentiment_classifying.classify_sentiment("We are moving ahead"))
     assert sentiment == "positive"
 
 
+def test_classify_sentiment_early_terminates_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    result = DummyStreamedResult(None, deltas=("neg", "ative", " extra trailing tokens"))
+
+    def fake_run_streamed(*args, **kwargs):  # noqa: ANN001, ANN002
+        return result
+
+    monkeypatch.setattr(sentiment_classifying.Runner, "run_streamed", fake_run_streamed)
+    sentiment = _run(sentiment_classifying.classify_sentiment("Service keeps dropping"))
+    assert sentiment == "negative"
+    assert result.cancelled
+
+
 def test_classify_sentiment_falls_back_on_error(monkeypatch: pytest.MonkeyPatch) -> None:
-    async def fake_run(*args, **kwargs):  # noqa: ANN001, ANN002
+    def fake_run_streamed(*args, **kwargs):  # noqa: ANN001, ANN002
         raise RuntimeError("boom")
 
-    monkeypatch.setattr(sentiment_classifying.Runner, "run", fake_run)
+    monkeypatch.setattr(sentiment_classifying.Runner, "run_streamed", fake_run_streamed)
     sentiment = _run(sentiment_classifying.classify_sentiment("This is absolutely terrible"))
     assert sentiment == "negative"
 
 
 def test_classify_sentiment_overrides_incorrect_positive(monkeypatch: pytest.MonkeyPatch) -> None:
-    async def fake_run(*args, **kwargs):  # noqa: ANN001, ANN002
-        return DummyResult("positive")
+    def fake_run_streamed(*args, **kwargs):  # noqa: ANN001, ANN002
+        return DummyStreamedResult("positive")
 
-    monkeypatch.setattr(sentiment_classifying.Runner, "run", fake_run)
+    monkeypatch.setattr(sentiment_classifying.Runner, "run_streamed", fake_run_streamed)
     sentiment = _run(sentiment_classifying.classify_sentiment("I am not happy about this result"))
     assert sentiment == "negative"
 
 
+def test_classify_sentiment_caches_repeated_text(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = {"count": 0}
+
+    def fake_run_streamed(*args, **kwargs):  # noqa: ANN001, ANN002
+        calls["count"] += 1
+        return DummyStreamedResult("positive")
+
+    monkeypatch.setattr(sentiment_classifying.Runner, "run_streamed", fake_run_streamed)
+    monkeypatch.setattr(sentiment_classifying, "_SENTIMENT_CACHE", type(sentiment_classifying._SENTIMENT_CACHE)())
+    assert _run(sentiment_classifying.classify_sentiment("Great work everyone")) == "positive"
+    assert _run(sentiment_classifying.classify_sentiment("great work everyone")) == "positive"
+    assert calls["count"] == 1
+
+
 def test_classify_sentiment_empty_text(monkeypatch: pytest.MonkeyPatch) -> None:
-    async def fake_run(*args, **kwargs):  # noqa: ANN001, ANN002
+    def fake_run_streamed(*args, **kwargs):  # noqa: ANN001, ANN002
         raise AssertionError("Agent should not be called for blank input")
 
-    monkeypatch.setattr(sentiment_classifying.Runner, "run", fake_run)
+    monkeypatch.setattr(sentiment_classifying.Runner, "run_streamed", fake_run_streamed)
     sentiment = _run(sentiment_classifying.classify_sentiment("   "))
     assert sentiment == "neutral"
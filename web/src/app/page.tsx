@@ -337,12 +337,8 @@ export default function Home() {
         for (let i = 0; i < inputBuffer.length; i += 1) {
           int16Buffer[i] = Math.max(-32768, Math.min(32767, inputBuffer[i] * 32768));
         }
-        ws.send(
-          JSON.stringify({
-            type: 'audio',
-            data: Array.from(int16Buffer),
-          })
-        );
+        // Raw binary frame: the server treats bytes as little-endian int16 PCM.
+        ws.send(int16Buffer.buffer);
       };
       audioContextRef.current = audioContext;
       processorRef.current = processor;
@@ -547,10 +543,28 @@ export default function Home() {
       } catch {}
     };
 
+    socket.binaryType = 'arraybuffer';
     socket.onmessage = (event) => {
       try {
+        // Binary frames carry tag-prefixed raw PCM from the assistant; no
+        // base64 round-trip. The avatar video carries playback audio, so the
+        // stream is surfaced as an audio event without decoding the payload.
+        if (event.data instanceof ArrayBuffer) {
+          const view = new Uint8Array(event.data);
+          if (view.length > 0 && view[0] === 0x01) {
+            handleRealtimeEvent({ type: 'audio' });
+          }
+          return;
+        }
         const payload: unknown = JSON.parse(event.data);
-        handleRealtimeEvent(payload);
+        // The server coalesces bursts of events into a single array frame.
+        if (Array.isArray(payload)) {
+          for (const item of payload) {
+            handleRealtimeEvent(item);
+          }
+        } else {
+          handleRealtimeEvent(payload);
+        }
       } catch (error) {
         logEvent('error', 'Malformed realtime payload', error instanceof Error ? error.message : 'Unknown parse error', 'error');
       }